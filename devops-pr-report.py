@@ -22,30 +22,95 @@ Defaults:
 """
 
 import argparse
+import functools
+import gzip
+import hashlib
+import http.client
 import json
+import os
 import re
 import subprocess
 import sys
-import urllib.request
-import urllib.error
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from html import escape
 from pathlib import Path
+from typing import Iterator, TextIO
+from urllib.parse import quote, urlencode, urlsplit
 
+try:
+    import orjson  # optional: parses API responses straight from bytes, several times faster
+except ImportError:
+    orjson = None
 
-def run_az(args: list[str], timeout: int = 30) -> str:
-    """Run an az CLI command and return stdout."""
+_json_loads = orjson.loads if orjson else json.loads
+
+
+def _json_dumps(obj) -> str:
+    """Serialize to compact JSON (no whitespace) for embedding in the report."""
+    if orjson:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _run_az_raw(args: list[str], timeout: int = 30) -> bytes:
+    """Run an az CLI command and return its raw stdout bytes."""
     result = subprocess.run(
         ["az"] + args,
-        capture_output=True, text=True, timeout=timeout
+        capture_output=True, timeout=timeout
     )
     if result.returncode != 0:
-        raise RuntimeError(f"az {' '.join(args[:4])}... failed: {result.stderr.strip()[:200]}")
-    return result.stdout.strip()
+        stderr = result.stderr.decode("utf-8", "replace").strip()
+        raise RuntimeError(f"az {' '.join(args[:4])}... failed: {stderr[:200]}")
+    return result.stdout
+
+
+def run_az(args: list[str], timeout: int = 30) -> str:
+    """Run an az CLI command and return stdout."""
+    return _run_az_raw(args, timeout).decode("utf-8", "replace").strip()
+
+
+def run_az_json(args: list[str], timeout: int = 30):
+    """Run an az CLI command with JSON output and parse stdout straight from bytes.
+
+    Returns None when the command prints nothing.
+    """
+    output = _run_az_raw(args, timeout)
+    return _json_loads(output) if output.strip() else None
+
+
+CACHE_DIR = Path.home() / ".cache" / "devops-pr-report"
+
+
+def _cached_json(path: Path, ttl_seconds: float, producer, use_cache: bool = True):
+    """Return the JSON cached at `path` if younger than `ttl_seconds`, else call
+    `producer()` and store its result. Empty results are not cached."""
+    if not use_cache:
+        return producer()
+    try:
+        if time.time() - path.stat().st_mtime < ttl_seconds:
+            return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass
+    value = producer()
+    if value:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    return value
 
 
-def get_defaults() -> dict:
+def _read_az_defaults() -> dict:
     output = run_az(["devops", "configure", "--list"])
     defaults = {}
     for line in output.splitlines():
@@ -55,40 +120,163 @@ def get_defaults() -> dict:
     return defaults
 
 
+def get_defaults(use_cache: bool = True) -> dict:
+    """Return `az devops configure` defaults, cached on disk for an hour."""
+    return _cached_json(CACHE_DIR / "defaults.json", 3600, _read_az_defaults, use_cache)
+
+
+_TOKEN_LOCK = threading.Lock()
+_TOKEN_CACHE: tuple[str, float] | None = None  # (token, time.monotonic() expiry)
+
+
+def _token_lifetime(data: dict) -> float:
+    """Seconds until a get-access-token result expires (0 if unknown)."""
+    if data.get("x"):
+        # expires_on: POSIX timestamp, az >= 2.54
+        return float(data["x"]) - time.time()
+    try:
+        # expiresOn: naive local time
+        return datetime.fromisoformat(data.get("e") or "").timestamp() - time.time()
+    except ValueError:
+        return 0.0
+
+
 def get_token() -> str:
-    return run_az([
-        "account", "get-access-token",
-        "--resource", "499b84ac-1321-427f-aa17-267ca6975798",
-        "--query", "accessToken", "-o", "tsv"
-    ])
+    """Return an Azure DevOps access token, cached in-process until shortly before expiry."""
+    global _TOKEN_CACHE
+    with _TOKEN_LOCK:
+        if _TOKEN_CACHE and time.monotonic() < _TOKEN_CACHE[1] - 60:
+            return _TOKEN_CACHE[0]
+        data = run_az_json([
+            "account", "get-access-token",
+            "--resource", "499b84ac-1321-427f-aa17-267ca6975798",
+            "--query", "{t:accessToken,e:expiresOn,x:expires_on}", "-o", "json",
+        ]) or {}
+        _TOKEN_CACHE = (data["t"], time.monotonic() + _token_lifetime(data))
+        return data["t"]
+
+
+_HTTP_LOCAL = threading.local()
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def http_get(url: str, headers: dict, timeout: float = 20.0, retries: int = 2) -> tuple[int, bytes]:
+    """GET a URL over a keep-alive connection reused per thread and host.
+
+    Bodies are requested gzip-compressed and transparently decompressed.
+    Dropped connections and 429/5xx responses are retried with a short backoff.
+    Returns (status, body).
+    """
+    headers = {**headers, "Accept-Encoding": "gzip"}
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    conns = getattr(_HTTP_LOCAL, "conns", None)
+    if conns is None:
+        conns = _HTTP_LOCAL.conns = {}
+    key = (parts.scheme, parts.netloc)
+
+    for attempt in range(retries + 1):
+        conn = conns.get(key)
+        if conn is None:
+            conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+            conn = conns[key] = conn_cls(parts.netloc, timeout=timeout)
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (http.client.HTTPException, OSError):
+            # Stale keep-alive socket or network hiccup: reconnect and retry
+            conn.close()
+            del conns[key]
+            if attempt == retries:
+                raise
+            continue
+        if resp.status in _RETRY_STATUSES and attempt < retries:
+            time.sleep(0.2 * 2 ** attempt)
+            continue
+        if resp.getheader("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return resp.status, body
 
 
 def api_get(url: str, token: str) -> dict:
-    req = urllib.request.Request(url, headers={
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-    })
     try:
-        with urllib.request.urlopen(req, timeout=20) as resp:
-            return json.loads(resp.read())
-    except (urllib.error.HTTPError, urllib.error.URLError):
+        status, body = http_get(url, {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        })
+    except (http.client.HTTPException, OSError):
+        return {}
+    if not 200 <= status < 300:
         return {}
+    return _json_loads(body)
 
 
 def list_projects(org: str) -> list[dict]:
     """List all projects in the organization."""
-    output = run_az([
+    data = run_az_json([
         "devops", "project", "list",
         "--org", org, "-o", "json",
         "--top", "500",
-    ], timeout=30)
-    data = json.loads(output) if output else {}
+    ], timeout=30) or {}
     return data.get("value", [])
 
 
+_IDENTITY_LOCK = threading.Lock()
+_IDENTITY_CACHE: dict[tuple[str, str], str | None] = {}
+
+
+def _identities_url(org: str) -> str:
+    """Map an org URL to its identity (vssps) service URL."""
+    org = org.rstrip("/")
+    if "://dev.azure.com/" in org:
+        return org.replace("://dev.azure.com/", "://vssps.dev.azure.com/")
+    return org.replace(".visualstudio.com", ".vssps.visualstudio.com")
+
+
+def resolve_identity_id(org: str, email: str, token: str) -> str | None:
+    """Resolve a user email to its Azure DevOps identity id (cached per run)."""
+    key = (org, email.lower())
+    with _IDENTITY_LOCK:
+        if key not in _IDENTITY_CACHE:
+            url = (f"{_identities_url(org)}/_apis/identities"
+                   f"?searchFilter=General&filterValue={quote(email)}&api-version=7.1")
+            matches = api_get(url, token).get("value", [])
+            _IDENTITY_CACHE[key] = matches[0]["id"] if matches else None
+        return _IDENTITY_CACHE[key]
+
+
+def _fetch_prs_rest(org: str, project: str, status: str,
+                    creator: str | None, top: int) -> list[dict] | None:
+    """Fetch PRs via the REST API; None if the call could not be made."""
+    token = get_token()
+    params = {"searchCriteria.status": status, "$top": top, "api-version": "7.1"}
+    if creator:
+        creator_id = resolve_identity_id(org, creator, token)
+        if not creator_id:
+            return None
+        params["searchCriteria.creatorId"] = creator_id
+    url = f"{org.rstrip('/')}/{quote(project)}/_apis/git/pullrequests?{urlencode(params, safe='$')}"
+    data = api_get(url, token)
+    return data["value"] if "value" in data else None
+
+
 def fetch_prs_for_project(org: str, project: str, status: str,
                           creator: str | None = None, top: int = 200) -> list[dict]:
-    """Fetch PRs for a project/status, optionally filtered by creator."""
+    """Fetch PRs for a project/status, optionally filtered by creator.
+
+    Goes through the REST API on the shared connection pool, falling back to
+    `az repos pr list` if the REST call fails.
+    """
+    try:
+        prs = _fetch_prs_rest(org, project, status, creator, top)
+    except (RuntimeError, KeyError, ValueError):
+        prs = None
+    if prs is not None:
+        return prs
+
     args = [
         "repos", "pr", "list",
         "--status", status,
@@ -100,8 +288,7 @@ def fetch_prs_for_project(org: str, project: str, status: str,
     if creator:
         args += ["--creator", creator]
     try:
-        output = run_az(args, timeout=30)
-        return json.loads(output) if output else []
+        return run_az_json(args, timeout=30) or []
     except (RuntimeError, json.JSONDecodeError):
         return []
 
@@ -141,12 +328,25 @@ def format_date(iso_str: str | None) -> str:
         return iso_str[:16] if iso_str else "\u2014"
 
 
-def days_ago(iso_str: str | None) -> str:
+def utc_day(iso_str: str | None) -> str:
+    """UTC calendar day (YYYY-MM-DD) of an ISO timestamp, or "" if unparsable."""
+    if not iso_str:
+        return ""
+    if iso_str.endswith("Z"):
+        return iso_str[:10]
+    try:
+        return datetime.fromisoformat(iso_str).astimezone(timezone.utc).date().isoformat()
+    except (ValueError, AttributeError):
+        return ""
+
+
+def days_ago(iso_str: str | None, now: datetime | None = None) -> str:
+    """Relative age of an ISO timestamp; pass `now` to reuse one clock reading across calls."""
     if not iso_str:
         return ""
     try:
         dt = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
-        delta = datetime.now(timezone.utc) - dt
+        delta = (now or datetime.now(timezone.utc)) - dt
         if delta.days == 0:
             hours = delta.seconds // 3600
             return f"{hours}h ago" if hours > 0 else "just now"
@@ -167,6 +367,7 @@ def pr_url(org: str, project: str, repo_name: str, pr_id: int) -> str:
     return f"{org}/{project}/_git/{repo_name}/pullrequest/{pr_id}"
 
 
+@functools.lru_cache(maxsize=None)
 def status_badge(status: str) -> str:
     colors = {"active": "#0078d4", "completed": "#107c10", "abandoned": "#a80000"}
     color = colors.get(status, "#666")
@@ -176,125 +377,143 @@ def status_badge(status: str) -> str:
 # ── HTML generation ──────────────────────────────────────────────────────────
 
 
-def build_pr_card(pr: dict) -> str:
-    """Build a single PR card HTML."""
-    # Files
-    files_html = ""
-    if pr.get("files"):
-        file_rows = []
-        for f in pr["files"]:
-            icon = {"add": "+", "edit": "~", "delete": "\u2212"}.get(f["type"], "?")
-            cls = {"add": "file-add", "edit": "file-edit", "delete": "file-delete"}.get(f["type"], "")
-            file_rows.append(
-                f'<tr><td class="file-change {cls}">{icon}</td>'
-                f'<td class="file-path">{escape(f["path"])}</td></tr>'
-            )
-        n = len(pr["files"])
-        files_html = (
-            f'<details class="files-section">'
-            f'<summary>{n} file{"s" if n != 1 else ""} changed</summary>'
-            f'<table class="file-table">{"".join(file_rows)}</table></details>'
+_CHANGE_ICONS = {"add": "+", "edit": "~", "delete": "\u2212"}
+_CHANGE_CLASSES = {"add": "file-add", "edit": "file-edit", "delete": "file-delete"}
+_VOTE_MARKS = {
+    10: ("&#10003;", "vote-approved"),
+    5: ("&#10003;", "vote-approved-suggest"),
+    -5: ("&#8265;", "vote-wait"),
+    -10: ("&#10007;", "vote-rejected"),
+}
+_NO_VOTE_MARK = ("&#8226;", "vote-none")
+
+
+def _card_files(files: list[dict]) -> Iterator[str]:
+    _e = escape
+    n = len(files)
+    yield (
+        f'<details class="files-section">'
+        f'<summary>{n} file{"s" if n != 1 else ""} changed</summary>'
+        f'<table class="file-table">'
+    )
+    for f in files:
+        yield (
+            f'<tr><td class="file-change {_CHANGE_CLASSES.get(f["type"], "")}">{_CHANGE_ICONS.get(f["type"], "?")}</td>'
+            f'<td class="file-path">{_e(f["path"])}</td></tr>'
         )
+    yield '</table></details>'
+
 
-    # Diff stats
+def _card_stats(diff: dict) -> str:
     parts = []
-    diff = pr.get("diff_stats", {})
     if diff.get("Add"):
         parts.append(f'<span class="stat-add">+{diff["Add"]} added</span>')
     if diff.get("Edit"):
         parts.append(f'<span class="stat-edit">~{diff["Edit"]} modified</span>')
     if diff.get("Delete"):
         parts.append(f'<span class="stat-del">\u2212{diff["Delete"]} deleted</span>')
-    stats_html = " ".join(parts)
+    return " ".join(parts)
 
-    # Reviewers
-    reviewers_html = ""
-    if pr.get("reviewers"):
-        items = []
-        for r in pr["reviewers"]:
-            v = r.get("vote", 0)
-            if v == 10:
-                icon, cls = "&#10003;", "vote-approved"
-            elif v == 5:
-                icon, cls = "&#10003;", "vote-approved-suggest"
-            elif v == -5:
-                icon, cls = "&#8265;", "vote-wait"
-            elif v == -10:
-                icon, cls = "&#10007;", "vote-rejected"
-            else:
-                icon, cls = "&#8226;", "vote-none"
-            items.append(f'<span class="reviewer {cls}" title="vote: {v}">{icon} {escape(r["name"])}</span>')
-        reviewers_html = f'<div class="reviewers">{"".join(items)}</div>'
-
-    # Description
-    desc = pr.get("description", "") or ""
-    if len(desc) > 400:
-        desc = desc[:400] + "..."
-    desc_html = f'<div class="pr-desc">{escape(desc)}</div>' if desc else ""
 
-    # Work items
-    wi_html = ""
-    if pr.get("work_items"):
-        wi_html = f'<div class="work-items">Work items: {", ".join("#" + w for w in pr["work_items"])}</div>'
+def _card_reviewers(reviewers: list[dict]) -> Iterator[str]:
+    _e = escape
+    yield '<div class="reviewers">'
+    for r in reviewers:
+        v = r.get("vote", 0)
+        icon, cls = _VOTE_MARKS.get(v, _NO_VOTE_MARK)
+        yield f'<span class="reviewer {cls}" title="vote: {v}">{icon} {_e(r["name"])}</span>'
+    yield '</div>'
 
-    closed_span = ""
-    if pr.get("closed") and pr["closed"] != "\u2014":
-        closed_span = f'<span>Closed: {pr["closed"]} ({pr["closed_ago"]})</span>'
 
-    creator_tag = ""
+_CARD_SECTION_SEP = "\n            "
+
+# PR statuses are a handful of fixed values; escape each only once
+_escape_status = functools.lru_cache(maxsize=None)(escape)
+
+
+def build_pr_card(pr: dict) -> Iterator[str]:
+    """Yield a single PR card's HTML in fragments.
+
+    Optional sections (creator, closed date, reviewers, description, work
+    items, files) are only rendered and emitted when the PR has them.
+    """
+    _e = escape
+    repo_name = pr['repo_name_html']
+    status = pr['status']
+
+    meta_tail = ""
     if pr.get("creator_name"):
-        creator_tag = f'<span class="pr-creator">{escape(pr["creator_name"])}</span>'
+        meta_tail = f'\n                <span class="pr-creator">{pr["creator_name_html"]}</span>'
 
-    return f"""
-    <div class="pr-card" data-status="{escape(pr['status'])}"
-         data-repo="{escape(pr['repo_name'])}"
-         data-user="{escape(pr.get('creator_email', ''))}"
-         data-project="{escape(pr.get('project_name', ''))}">
+    dates_tail = ""
+    if pr.get("closed") and pr["closed"] != "\u2014":
+        dates_tail = f'\n                <span>Closed: {pr["closed"]} ({pr["closed_ago"]})</span>'
+
+    yield f"""
+    <div class="pr-card" data-status="{_escape_status(status)}"
+         data-repo="{repo_name}"
+         data-user="{pr['creator_email_html']}"
+         data-project="{pr['project_name_html']}">
         <div class="pr-header">
-            <a href="{escape(pr['url'])}" target="_blank" class="pr-title">{escape(pr['title'])}</a>
+            <a href="{_e(pr['url'])}" target="_blank" class="pr-title">{_e(pr['title'])}</a>
             <div class="pr-meta">
-                {status_badge(pr['status'])}
+                {status_badge(status)}
                 <span class="pr-id">#{pr['pr_id']}</span>
-                <span class="pr-repo">{escape(pr['repo_name'])}</span>
-                {creator_tag}
+                <span class="pr-repo">{repo_name}</span>{meta_tail}
             </div>
         </div>
         <div class="pr-details">
             <div class="pr-branches">
-                <code>{escape(pr['source_branch'])}</code> &rarr; <code>{escape(pr['target_branch'])}</code>
+                <code>{_e(pr['source_branch'])}</code> &rarr; <code>{_e(pr['target_branch'])}</code>
             </div>
             <div class="pr-dates">
-                <span>Created: {pr['created']} ({pr['created_ago']})</span>
-                {closed_span}
-            </div>
-            {reviewers_html}
-            {desc_html}
-            {wi_html}
-            <div class="pr-stats">{stats_html}</div>
-            {files_html}
-        </div>
-    </div>"""
+                <span>Created: {pr['created']} ({pr['created_ago']})</span>{dates_tail}
+            </div>{_CARD_SECTION_SEP}"""
+    sep = _CARD_SECTION_SEP
+
+    if pr.get("reviewers"):
+        yield from _card_reviewers(pr["reviewers"])
+        yield sep
+    if pr.get("description"):
+        yield f'<div class="pr-desc">{pr["description_html"]}</div>{sep}'
+    if pr.get("work_items"):
+        yield f'<div class="work-items">Work items: {", ".join("#" + w for w in pr["work_items"])}</div>{sep}'
+    yield f'<div class="pr-stats">{_card_stats(pr.get("diff_stats", {}))}</div>'
+    if pr.get("files"):
+        yield sep
+        yield from _card_files(pr["files"])
+
+    yield "\n        </div>\n    </div>"
 
 
 def _anthropic_api_get(url: str, api_key: str) -> dict | None:
     """Fetch a single page from the Anthropic admin API."""
-    req = urllib.request.Request(url, headers={
-        "x-api-key": api_key,
-        "anthropic-version": "2023-06-01",
-        "Content-Type": "application/json",
-    })
     try:
-        with urllib.request.urlopen(req, timeout=20) as resp:
-            return json.loads(resp.read())
-    except urllib.error.HTTPError as e:
-        body = e.read().decode() if e.fp else ""
-        print(f"  Anthropic API error {e.code}: {body[:200]}", file=sys.stderr)
+        status, body = http_get(url, {
+            "x-api-key": api_key,
+            "anthropic-version": "2023-06-01",
+            "Content-Type": "application/json",
+        })
+    except (http.client.HTTPException, OSError) as e:
+        print(f"  Anthropic API request failed: {e}", file=sys.stderr)
         return None
+    if not 200 <= status < 300:
+        print(f"  Anthropic API error {status}: {body.decode(errors='replace')[:200]}", file=sys.stderr)
+        return None
+    return _json_loads(body)
+
 
+def fetch_api_keys(api_key: str, use_cache: bool = True) -> dict[str, str]:
+    """Fetch API key list and return {key_id: key_name} mapping.
 
-def fetch_api_keys(api_key: str) -> dict[str, str]:
-    """Fetch API key list and return {key_id: key_name} mapping."""
-    from urllib.parse import urlencode
+    Cached on disk for 15 minutes, keyed by a hash of the admin key.
+    """
+    digest = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+    return _cached_json(CACHE_DIR / f"api-keys-{digest}.json", 15 * 60,
+                        lambda: _fetch_api_keys(api_key), use_cache)
+
+
+def _fetch_api_keys(api_key: str) -> dict[str, str]:
     key_map = {}
     url = f"https://api.anthropic.com/v1/organizations/api_keys?limit=100"
     while url:
@@ -310,6 +529,13 @@ def fetch_api_keys(api_key: str) -> dict[str, str]:
     return key_map
 
 
+# Alternatives are tried in order:
+#   claude_code_key_{user}_{random}
+#   {user}-key, {user}-something
+#   whole name if short enough
+_KEYNAME_RE = re.compile(r"claude_code_key_([a-z]+)_|([a-z]{2,6})[-_]|([a-z]{2,6})$")
+
+
 def extract_user_from_keyname(name: str) -> str:
     """Extract user initials from API key name.
 
@@ -321,21 +547,9 @@ def extract_user_from_keyname(name: str) -> str:
       DaveM                       -> davem
     """
     name_lower = name.lower().strip()
-
-    # Pattern: claude_code_key_{user}_{random}
-    m = re.match(r"claude_code_key_([a-z]+)_", name_lower)
+    m = _KEYNAME_RE.match(name_lower)
     if m:
-        return m.group(1)
-
-    # Pattern: {user}-key, {user}-something
-    m = re.match(r"([a-z]{2,6})[-_]", name_lower)
-    if m:
-        return m.group(1)
-
-    # Fallback: whole name if short enough
-    if re.match(r"^[a-z]{2,6}$", name_lower):
-        return name_lower
-
+        return m.group(m.lastindex)
     return name_lower[:10]
 
 
@@ -385,8 +599,6 @@ def map_keys_to_people(key_map: dict[str, str], prs_data: list[dict]) -> dict:
 
 def fetch_anthropic_usage(api_key: str, days: int) -> list[dict]:
     """Fetch daily token usage from Anthropic admin API, grouped by api_key_id and model."""
-    from urllib.parse import urlencode
-
     start = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%dT00:00:00Z")
     end = datetime.now(timezone.utc).strftime("%Y-%m-%dT23:59:59Z")
 
@@ -429,42 +641,73 @@ _MODEL_PRICING = {
 }
 
 
+# Longest prefix first, so a more specific entry (e.g. "claude-opus-4-5") wins
+# over its family ("claude-opus-4") regardless of dict order
+_PRICING_PREFIXES = sorted(
+    ((p, v) for p, v in _MODEL_PRICING.items() if p != "_default"),
+    key=lambda item: len(item[0]), reverse=True,
+)
+
+
+@functools.lru_cache(maxsize=64)
 def _get_pricing(model: str) -> tuple:
-    """Get pricing tuple for a model name."""
+    """Get pricing tuple for a model name (longest matching prefix)."""
+    if model in _MODEL_PRICING and model != "_default":
+        return _MODEL_PRICING[model]
     model_lower = (model or "").lower()
-    for prefix, pricing in _MODEL_PRICING.items():
-        if prefix != "_default" and model_lower.startswith(prefix):
+    for prefix, pricing in _PRICING_PREFIXES:
+        if model_lower.startswith(prefix):
             return pricing
     return _MODEL_PRICING["_default"]
 
 
+@functools.lru_cache(maxsize=64)
+def _token_rates(model: str) -> tuple[float, float, float, float]:
+    """Per-token USD rates for a model, derived once from the per-million pricing."""
+    return tuple(price / 1_000_000 for price in _get_pricing(model))
+
+
 def _calc_cost(result: dict) -> float:
     """Calculate USD cost for a usage result based on model pricing."""
-    model = result.get("model") or ""
-    inp_price, cache_read_price, cache_write_price, out_price = _get_pricing(model)
-
-    uncached_input = result.get("uncached_input_tokens", 0)
-    cache_read = result.get("cache_read_input_tokens", 0)
-    output = result.get("output_tokens", 0)
-    cc = result.get("cache_creation", {})
-    cache_write = cc.get("ephemeral_5m_input_tokens", 0) + cc.get("ephemeral_1h_input_tokens", 0)
-
-    cost = (
-        uncached_input * inp_price / 1_000_000
-        + cache_read * cache_read_price / 1_000_000
-        + cache_write * cache_write_price / 1_000_000
-        + output * out_price / 1_000_000
+    inp_rate, cache_read_rate, cache_write_rate, out_rate = _token_rates(result.get("model") or "")
+
+    cc = result.get("cache_creation") or {}
+    return (
+        result.get("uncached_input_tokens", 0) * inp_rate
+        + result.get("cache_read_input_tokens", 0) * cache_read_rate
+        + (cc.get("ephemeral_5m_input_tokens", 0) + cc.get("ephemeral_1h_input_tokens", 0)) * cache_write_rate
+        + result.get("output_tokens", 0) * out_rate
     )
-    return cost
 
 
-def build_consumption_chart(prs_data: list[dict], usage_buckets: list[dict],
+def flatten_usage(usage_buckets: list[dict]) -> tuple[list[str], list[str], list[float]]:
+    """Price every usage result once into parallel (date, api_key_id, cost) columns.
+
+    Results with no cost are dropped.
+    """
+    dates, key_ids, costs = [], [], []
+    calc_cost = _calc_cost
+    for bucket in usage_buckets:
+        date_str = bucket.get("starting_at", "")[:10]
+        for result in bucket.get("results", []):
+            cost = calc_cost(result)
+            if cost <= 0:
+                continue
+            dates.append(date_str)
+            key_ids.append(result.get("api_key_id", ""))
+            costs.append(cost)
+    return dates, key_ids, costs
+
+
+def build_consumption_chart(prs_data: list[dict],
+                            usage: tuple[list[str], list[str], list[float]] | None,
                             days: int, people: dict | None = None) -> str:
-    """Build dual-axis chart: PR bars + cost line ($), filterable by person."""
-    if not usage_buckets:
-        return ""
+    """Build dual-axis chart: PR bars + cost line ($), filterable by person.
 
-    from collections import defaultdict
+    `usage` is the column triple from flatten_usage().
+    """
+    if not usage:
+        return ""
 
     # Build full date range
     today = datetime.now(timezone.utc).date()
@@ -483,54 +726,56 @@ def build_consumption_chart(prs_data: list[dict], usage_buckets: list[dict],
             for kid in info["key_ids"]:
                 key_to_person[kid] = initials
 
-    # Build daily cost per person (in USD)
-    person_daily = defaultdict(lambda: defaultdict(float))
-    all_daily = defaultdict(float)
+    # Daily rows indexed by position in `dates`; days outside the range are dropped
+    day_idx = {d: i for i, d in enumerate(dates)}
+    n_days = len(dates)
 
-    for bucket in usage_buckets:
-        date_str = bucket.get("starting_at", "")[:10]
-        for result in bucket.get("results", []):
-            cost = _calc_cost(result)
-            if cost <= 0:
-                continue
-            all_daily[date_str] += cost
-            key_id = result.get("api_key_id", "")
-            person = key_to_person.get(key_id, "_other")
-            person_daily[person][date_str] += cost
+    # Build daily cost per person (in USD)
+    cost_daily = [0.0] * n_days
+    person_cost = {}
+    for date_str, key_id, cost in zip(*usage):
+        i = day_idx.get(date_str)
+        if i is None:
+            continue
+        cost_daily[i] += cost
+        person = key_to_person.get(key_id, "_other")
+        row = person_cost.get(person)
+        if row is None:
+            row = person_cost[person] = [0.0] * n_days
+        row[i] += cost
 
     # Build daily PR counts per person (matched by email prefix)
-    pr_daily_all = defaultdict(int)
-    pr_daily_person = defaultdict(lambda: defaultdict(int))
-
+    pr_counts_all = [0] * n_days
+    person_prs = {}
     for pr in prs_data:
-        raw = pr.get("created", "")
-        try:
-            dt = datetime.strptime(raw, "%b %d, %Y %H:%M")
-            date_key = dt.strftime("%Y-%m-%d")
-        except (ValueError, AttributeError):
+        i = day_idx.get(pr.get("created_day", ""))
+        if i is None:
             continue
-        pr_daily_all[date_key] += 1
+        pr_counts_all[i] += 1
         email = pr.get("creator_email", "")
         prefix = email.split("@")[0].lower() if email else ""
-        if people and prefix in people:
-            pr_daily_person[prefix][date_key] += 1
-        else:
-            pr_daily_person["_other"][date_key] += 1
+        person = prefix if people and prefix in people else "_other"
+        row = person_prs.get(person)
+        if row is None:
+            row = person_prs[person] = [0] * n_days
+        row[i] += 1
 
     # Data arrays (costs in USD)
-    pr_counts_all = [pr_daily_all.get(d, 0) for d in dates]
-    cost_all = [round(all_daily.get(d, 0), 2) for d in dates]
+    cost_all = [round(c, 2) for c in cost_daily]
 
-    # Per-person data
+    # Per-person data; totals are summed once here and reused below
     persons_data = {}
     persons_pr_data = {}
+    person_totals = {}
     if people:
-        for initials, info in sorted(people.items(), key=lambda x: x[0]):
-            cost_arr = [round(person_daily[initials].get(d, 0), 2) for d in dates]
-            pr_arr = [pr_daily_person[initials].get(d, 0) for d in dates]
-            if sum(cost_arr) > 0 or sum(pr_arr) > 0:
+        for initials in sorted(people):
+            cost_arr = [round(c, 2) for c in person_cost.get(initials, [0.0] * n_days)]
+            pr_arr = person_prs.get(initials, [0] * n_days)
+            cost_total, pr_total = sum(cost_arr), sum(pr_arr)
+            if cost_total > 0 or pr_total > 0:
                 persons_data[initials] = cost_arr
                 persons_pr_data[initials] = pr_arr
+                person_totals[initials] = (cost_total, pr_total)
 
     # Colors
     person_colors = [
@@ -546,8 +791,7 @@ def build_consumption_chart(prs_data: list[dict], usage_buckets: list[dict],
     # Per-person summary for stats table
     person_summaries = []
     for initials in sorted_persons:
-        cost = sum(persons_data.get(initials, []))
-        prs = sum(persons_pr_data.get(initials, []))
+        cost, prs = person_totals[initials]
         name = people[initials]["display_name"] if people and initials in people else initials.upper()
         pct = (cost / grand_total * 100) if grand_total > 0 else 0
         cost_per_pr = cost / max(1, prs)
@@ -581,7 +825,7 @@ def build_consumption_chart(prs_data: list[dict], usage_buckets: list[dict],
             f'<td class="num">${cost_per_pr:,.2f}</td></tr>'
         )
 
-    chart_data = json.dumps({
+    chart_data = _json_dumps({
         "labels": labels,
         "prCountsAll": pr_counts_all,
         "costAll": cost_all,
@@ -653,9 +897,14 @@ def build_consumption_chart(prs_data: list[dict], usage_buckets: list[dict],
             return '$' + val.toFixed(2);
         }}
 
-        function draw() {{
-            const rect = canvas.parentElement.getBoundingClientRect();
-            const W = rect.width;
+        // Layout is read in measure() only; render() just writes, so a
+        // redraw never forces a synchronous reflow
+        let W = 0;
+        function measure() {{
+            W = canvas.parentElement.getBoundingClientRect().width;
+        }}
+
+        function render() {{
             const H = 280;
             canvas.width = W * dpr;
             canvas.height = H * dpr;
@@ -702,12 +951,14 @@ def build_consumption_chart(prs_data: list[dict], usage_buckets: list[dict],
             // PR bars
             const barColor = activePerson !== 'all' && data.personColors[activePerson]
                 ? data.personColors[activePerson] + '66' : 'rgba(88,166,255,0.4)';
-            ctx.fillStyle = barColor;
+            ctx.beginPath();
             for (let i = 0; i < n; i++) {{
                 const x = pad.left + (i / n) * cW + ((cW / n) - barW) / 2;
                 const h = (prData[i] / niceMaxPR) * cH;
-                ctx.fillRect(x, pad.top + cH - h, barW, h);
+                ctx.rect(x, pad.top + cH - h, barW, h);
             }}
+            ctx.fillStyle = barColor;
+            ctx.fill();
 
             // Cost line
             ctx.beginPath();
@@ -725,21 +976,29 @@ def build_consumption_chart(prs_data: list[dict], usage_buckets: list[dict],
             ctx.closePath(); ctx.fillStyle = 'rgba(240,136,62,0.08)'; ctx.fill();
 
             // Dots
-            ctx.fillStyle = '#f0883e';
+            ctx.beginPath();
             for (let i = 0; i < n; i++) {{
                 const x = pad.left + (i/n)*cW + (cW/n)/2;
                 const y = pad.top + cH - (costData[i]/niceMaxCost)*cH;
-                ctx.beginPath(); ctx.arc(x, y, 3, 0, Math.PI*2); ctx.fill();
+                ctx.moveTo(x + 3, y); ctx.arc(x, y, 3, 0, Math.PI*2);
             }}
+            ctx.fillStyle = '#f0883e';
+            ctx.fill();
 
             // X labels
             ctx.fillStyle = '#8b949e'; ctx.font = '10px -apple-system, sans-serif'; ctx.textAlign = 'center';
             const labelEvery = Math.max(1, Math.floor(n / 10));
+            // One save/restore around the loop; each label sets its own
+            // scale+translate+rotate matrix directly
+            const cos = Math.cos(-0.5) * dpr, sin = Math.sin(-0.5) * dpr;
+            const labelY = (H - pad.bottom + 14) * dpr;
+            ctx.save();
             for (let i = 0; i < n; i += labelEvery) {{
                 const x = pad.left + (i/n)*cW + (cW/n)/2;
-                ctx.save(); ctx.translate(x, H - pad.bottom + 14); ctx.rotate(-0.5);
-                ctx.fillText(data.labels[i], 0, 0); ctx.restore();
+                ctx.setTransform(cos, sin, -sin, cos, x * dpr, labelY);
+                ctx.fillText(data.labels[i], 0, 0);
             }}
+            ctx.restore();
 
             // Axis titles
             ctx.save(); ctx.fillStyle='#58a6ff'; ctx.font='11px -apple-system, sans-serif';
@@ -755,11 +1014,30 @@ def build_consumption_chart(prs_data: list[dict], usage_buckets: list[dict],
             activePerson = person;
             document.querySelectorAll('.cons-filter').forEach(b => b.classList.remove('active'));
             event.target.classList.add('active');
-            draw();
+            render();
         }};
 
-        draw();
-        window.addEventListener('resize', draw);
+        // Resize bursts collapse into at most one redraw per frame, and none
+        // at all when the width did not actually change
+        let drawPending = false, lastW = -1;
+        function requestDraw() {{
+            if (drawPending) return;
+            drawPending = true;
+            requestAnimationFrame(() => {{
+                drawPending = false;
+                measure();
+                if (W === lastW) return;
+                lastW = W;
+                render();
+            }});
+        }}
+
+        // First draw waits until the browser is idle, so the script does not
+        // force a layout mid-parse or hold up painting of the PR list below
+        const firstDraw = () => {{ measure(); lastW = W; render(); }};
+        if (window.requestIdleCallback) requestIdleCallback(firstDraw, {{ timeout: 500 }});
+        else setTimeout(firstDraw, 0);
+        window.addEventListener('resize', requestDraw);
     }})();
     </script>"""
 
@@ -769,19 +1047,6 @@ def build_timeline_chart(prs_data: list[dict], days: int) -> str:
     if not prs_data:
         return ""
 
-    # Bucket PRs by date (created date)
-    from collections import defaultdict
-    daily = defaultdict(lambda: {"completed": 0, "active": 0, "abandoned": 0})
-
-    for pr in prs_data:
-        raw = pr.get("created", "")
-        try:
-            dt = datetime.strptime(raw, "%b %d, %Y %H:%M")
-            key = dt.strftime("%Y-%m-%d")
-            daily[key][pr["status"]] += 1
-        except (ValueError, AttributeError):
-            pass
-
     # Build full date range
     today = datetime.now(timezone.utc).date()
     start = today - timedelta(days=days)
@@ -791,18 +1056,31 @@ def build_timeline_chart(prs_data: list[dict], days: int) -> str:
         dates.append(d.strftime("%Y-%m-%d"))
         d += timedelta(days=1)
 
-    # Build data arrays
-    completed_data = [daily[d]["completed"] for d in dates]
-    active_data = [daily[d]["active"] for d in dates]
-    abandoned_data = [daily[d]["abandoned"] for d in dates]
+    # One count column per status, indexed by day position; PRs outside the
+    # range or with other statuses are dropped, as before
+    day_idx = {d: i for i, d in enumerate(dates)}
+    completed_data = [0] * len(dates)
+    active_data = [0] * len(dates)
+    abandoned_data = [0] * len(dates)
+    columns = {"completed": completed_data, "active": active_data, "abandoned": abandoned_data}
+
+    for pr in prs_data:
+        i = day_idx.get(pr.get("created_day"))
+        col = columns.get(pr["status"])
+        if i is not None and col is not None:
+            col[i] += 1
+
     labels = [datetime.strptime(d, "%Y-%m-%d").strftime("%b %d") for d in dates]
 
-    # JSON-encode for JS
-    chart_data = json.dumps({
+    per_day = list(zip(completed_data, active_data, abandoned_data))
+    max_total = max(map(sum, per_day), default=0)
+
+    # JSON-encode for JS; counts are one flat [completed, active, abandoned]
+    # triple per day, loaded into an Int32Array on the client
+    chart_data = _json_dumps({
         "labels": labels,
-        "completed": completed_data,
-        "active": active_data,
-        "abandoned": abandoned_data,
+        "counts": [v for day in per_day for v in day],
+        "maxVal": max_total or 1,
     })
 
     return f"""
@@ -813,34 +1091,36 @@ def build_timeline_chart(prs_data: list[dict], days: int) -> str:
     <script>
     (function() {{
         const data = {chart_data};
+        const counts = new Int32Array(data.counts);
         const canvas = document.getElementById('timelineChart');
         const ctx = canvas.getContext('2d');
         const dpr = window.devicePixelRatio || 1;
 
-        function draw() {{
-            const rect = canvas.parentElement.getBoundingClientRect();
-            canvas.width = rect.width * dpr;
-            canvas.height = 220 * dpr;
-            canvas.style.width = rect.width + 'px';
-            canvas.style.height = '220px';
-            ctx.scale(dpr, dpr);
+        const LEGEND = [['Completed', '#3fb950'], ['Active', '#58a6ff'], ['Abandoned', '#a80000']];
+        let legendWidths = null;
 
-            const W = rect.width;
+        // Layout is read in measure() only; render() just writes
+        let W = 0;
+        function measure() {{
+            W = canvas.parentElement.getBoundingClientRect().width;
+        }}
+
+        function render() {{
             const H = 220;
+            canvas.width = W * dpr;
+            canvas.height = H * dpr;
+            canvas.style.width = W + 'px';
+            canvas.style.height = H + 'px';
+            ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+
             const pad = {{ top: 20, right: 20, bottom: 40, left: 40 }};
             const chartW = W - pad.left - pad.right;
             const chartH = H - pad.top - pad.bottom;
             const n = data.labels.length;
             const barW = Math.max(2, (chartW / n) - 1);
 
-            // Max value
-            let maxVal = 0;
-            for (let i = 0; i < n; i++) {{
-                const total = data.completed[i] + data.active[i] + data.abandoned[i];
-                if (total > maxVal) maxVal = total;
-            }}
-            if (maxVal === 0) maxVal = 1;
-            // Round up to nice number
+            // Max stacked value is precomputed server-side; round up to nice number
+            const maxVal = data.maxVal;
             const niceMax = Math.ceil(maxVal / Math.max(1, Math.ceil(maxVal / 5))) * Math.max(1, Math.ceil(maxVal / 5));
 
             ctx.clearRect(0, 0, W, H);
@@ -862,20 +1142,21 @@ def build_timeline_chart(prs_data: list[dict], days: int) -> str:
                 ctx.fillText(val, pad.left - 6, y + 4);
             }}
 
-            // Bars (stacked)
-            const colors = {{ completed: '#3fb950', active: '#58a6ff', abandoned: '#a80000' }};
-            for (let i = 0; i < n; i++) {{
-                const x = pad.left + (i / n) * chartW + 0.5;
-                let yBase = pad.top + chartH;
-
-                for (const status of ['completed', 'active', 'abandoned']) {{
-                    const val = data[status][i];
-                    if (val === 0) continue;
-                    const barH = (val / niceMax) * chartH;
-                    ctx.fillStyle = colors[status];
-                    ctx.fillRect(x, yBase - barH, barW, barH);
-                    yBase -= barH;
+            // Bars (stacked): one path and a single fill per status; status k
+            // of day i is counts[3*i + k] (completed, active, abandoned)
+            const colors = ['#3fb950', '#58a6ff', '#a80000'];
+            const yBase = new Float64Array(n).fill(pad.top + chartH);
+            for (let k = 0; k < 3; k++) {{
+                ctx.beginPath();
+                for (let i = 0; i < n; i++) {{
+                    const v = counts[3 * i + k];
+                    if (v === 0) continue;
+                    const barH = (v / niceMax) * chartH;
+                    yBase[i] -= barH;
+                    ctx.rect(pad.left + (i / n) * chartW + 0.5, yBase[i], barW, barH);
                 }}
+                ctx.fillStyle = colors[k];
+                ctx.fill();
             }}
 
             // X-axis labels (show ~8-12 labels)
@@ -883,57 +1164,98 @@ def build_timeline_chart(prs_data: list[dict], days: int) -> str:
             ctx.font = '10px -apple-system, sans-serif';
             ctx.textAlign = 'center';
             const labelEvery = Math.max(1, Math.floor(n / 10));
+            // One save/restore around the loop; each label sets its own
+            // scale+translate+rotate matrix directly
+            const cos = Math.cos(-0.5) * dpr, sin = Math.sin(-0.5) * dpr;
+            const labelY = (H - pad.bottom + 14) * dpr;
+            ctx.save();
             for (let i = 0; i < n; i += labelEvery) {{
                 const x = pad.left + (i / n) * chartW + barW / 2;
-                ctx.save();
-                ctx.translate(x, H - pad.bottom + 14);
-                ctx.rotate(-0.5);
+                ctx.setTransform(cos, sin, -sin, cos, x * dpr, labelY);
                 ctx.fillText(data.labels[i], 0, 0);
-                ctx.restore();
             }}
+            ctx.restore();
 
-            // Legend
+            // Legend; labels and font never change, so widths are measured once
             const legendY = pad.top - 6;
             let legendX = pad.left;
-            for (const [label, color] of [['Completed', '#3fb950'], ['Active', '#58a6ff'], ['Abandoned', '#a80000']]) {{
+            ctx.font = '11px -apple-system, sans-serif';
+            ctx.textAlign = 'left';
+            if (!legendWidths) legendWidths = LEGEND.map(([label]) => ctx.measureText(label).width);
+            LEGEND.forEach(([label, color], i) => {{
                 ctx.fillStyle = color;
                 ctx.fillRect(legendX, legendY - 8, 10, 10);
                 ctx.fillStyle = '#8b949e';
-                ctx.font = '11px -apple-system, sans-serif';
-                ctx.textAlign = 'left';
                 ctx.fillText(label, legendX + 14, legendY + 1);
-                legendX += ctx.measureText(label).width + 28;
-            }}
+                legendX += legendWidths[i] + 28;
+            }});
         }}
 
-        draw();
-        window.addEventListener('resize', draw);
+        // Resize bursts collapse into at most one redraw per frame, and none
+        // at all when the width did not actually change
+        let drawPending = false, lastW = -1;
+        function requestDraw() {{
+            if (drawPending) return;
+            drawPending = true;
+            requestAnimationFrame(() => {{
+                drawPending = false;
+                measure();
+                if (W === lastW) return;
+                lastW = W;
+                render();
+            }});
+        }}
+
+        // First draw waits until the browser is idle, so the script does not
+        // force a layout mid-parse or hold up painting of the PR list below
+        const firstDraw = () => {{ measure(); lastW = W; render(); }};
+        if (window.requestIdleCallback) requestIdleCallback(firstDraw, {{ timeout: 500 }});
+        else setTimeout(firstDraw, 0);
+        window.addEventListener('resize', requestDraw);
     }})();
     </script>"""
 
 
+@dataclass(slots=True)
+class UserAgg:
+    """Per-author PR totals for the user comparison (names pre-escaped)."""
+    name: str = ""
+    email: str = ""
+    total: int = 0
+    completed: int = 0
+    active: int = 0
+    abandoned: int = 0
+    files: int = 0
+    projects: set = field(default_factory=set)
+    repos: set = field(default_factory=set)
+
+
 def build_user_comparison(prs_data: list[dict]) -> str:
     """Build user comparison table + bar chart."""
-    users = {}
+    users: defaultdict[str, UserAgg] = defaultdict(UserAgg)
     for pr in prs_data:
-        email = pr.get("creator_email", "unknown")
-        name = pr.get("creator_name", email)
-        if email not in users:
-            users[email] = {"name": name, "total": 0, "completed": 0, "active": 0,
-                            "abandoned": 0, "files": 0, "projects": set(), "repos": set()}
-        u = users[email]
-        u["total"] += 1
-        u[pr["status"]] = u.get(pr["status"], 0) + 1
-        u["files"] += len(pr.get("files", []))
-        u["projects"].add(pr.get("project_name", ""))
-        u["repos"].add(pr.get("repo_name", ""))
+        u = users[pr["creator_email"]]
+        if not u.total:
+            u.name = pr["creator_name_html"]
+            u.email = pr["creator_email_html"]
+        u.total += 1
+        status = pr["status"]
+        if status == "completed":
+            u.completed += 1
+        elif status == "active":
+            u.active += 1
+        elif status == "abandoned":
+            u.abandoned += 1
+        u.files += len(pr.get("files", []))
+        u.projects.add(pr.get("project_name", ""))
+        u.repos.add(pr.get("repo_name", ""))
 
     if len(users) < 2:
         return ""
 
     # Sort by total PRs descending
-    sorted_users = sorted(users.items(), key=lambda x: x[1]["total"], reverse=True)
-    max_total = max(u["total"] for _, u in sorted_users) if sorted_users else 1
+    sorted_users = sorted(users.values(), key=lambda u: u.total, reverse=True)
+    max_total = sorted_users[0].total
 
     # Colors for bar chart
     bar_colors = ["#58a6ff", "#3fb950", "#d29922", "#f85149", "#bc8cff",
@@ -941,34 +1263,36 @@ def build_user_comparison(prs_data: list[dict]) -> str:
 
     rows = []
     bars = []
-    for i, (email, u) in enumerate(sorted_users):
+    for i, u in enumerate(sorted_users):
         color = bar_colors[i % len(bar_colors)]
-        pct = (u["total"] / max_total) * 100
+        pct = (u.total / max_total) * 100
         rows.append(f"""
-        <tr class="user-row" onclick="filterByUser('{escape(email)}')" style="cursor:pointer">
-            <td><span class="user-dot" style="background:{color}"></span>{escape(u['name'])}</td>
-            <td class="num">{u['total']}</td>
-            <td class="num" style="color:var(--green)">{u['completed']}</td>
-            <td class="num" style="color:var(--blue)">{u['active']}</td>
-            <td class="num">{u['files']}</td>
-            <td class="num">{len(u['projects'])}</td>
-            <td class="num">{len(u['repos'])}</td>
+        <tr class="user-row" onclick="filterByUser('{u.email}')" style="cursor:pointer">
+            <td><span class="user-dot" style="background:{color}"></span>{u.name}</td>
+            <td class="num">{u.total}</td>
+            <td class="num" style="color:var(--green)">{u.completed}</td>
+            <td class="num" style="color:var(--blue)">{u.active}</td>
+            <td class="num">{u.files}</td>
+            <td class="num">{len(u.projects)}</td>
+            <td class="num">{len(u.repos)}</td>
         </tr>""")
         bars.append(f"""
-        <div class="bar-row" onclick="filterByUser('{escape(email)}')" style="cursor:pointer">
-            <div class="bar-label">{escape(u['name'].split()[0] if ' ' in u['name'] else u['name'])}</div>
+        <div class="bar-row" onclick="filterByUser('{u.email}')" style="cursor:pointer">
+            <div class="bar-label">{u.name.split()[0] if ' ' in u.name else u.name}</div>
             <div class="bar-track">
                 <div class="bar-fill" style="width:{pct}%;background:{color}"></div>
-                <span class="bar-value">{u['total']}</span>
+                <span class="bar-value">{u.total}</span>
             </div>
         </div>""")
 
-    return f"""
+    parts = ["""
     <div class="comparison-section">
         <h2>User Comparison</h2>
         <div class="comparison-grid">
             <div class="bar-chart">
-                {"".join(bars)}
+                """]
+    parts.extend(bars)
+    parts.append("""
             </div>
             <div class="comparison-table-wrap">
                 <table class="comparison-table">
@@ -978,254 +1302,318 @@ def build_user_comparison(prs_data: list[dict]) -> str:
                             <th>Active</th><th>Files</th><th>Projects</th><th>Repos</th>
                         </tr>
                     </thead>
-                    <tbody>{"".join(rows)}</tbody>
+                    <tbody>""")
+    parts.extend(rows)
+    parts.append("""</tbody>
                 </table>
             </div>
         </div>
-    </div>"""
-
-
-def generate_html(prs_data: list[dict], title: str, subtitle: str, org: str,
-                   days: int = 30, usage_buckets: list[dict] | None = None,
-                   people: dict | None = None) -> str:
-    """Generate the full HTML report."""
-    now = datetime.now(timezone.utc).strftime("%b %d, %Y %H:%M UTC")
-
-    total = len(prs_data)
-    completed = sum(1 for p in prs_data if p["status"] == "completed")
-    active = sum(1 for p in prs_data if p["status"] == "active")
-    total_files = sum(len(p.get("files", [])) for p in prs_data)
-    users = sorted(set((p.get("creator_email", ""), p.get("creator_name", "")) for p in prs_data))
-    repos = sorted(set(p["repo_name"] for p in prs_data))
-    projects = sorted(set(p.get("project_name", "") for p in prs_data))
-
-    pr_cards = "".join(build_pr_card(pr) for pr in prs_data)
-    if not pr_cards:
-        pr_cards = '<div class="empty-state">No pull requests found for this period.</div>'
-
-    consumption_html = build_consumption_chart(prs_data, usage_buckets or [], days, people=people)
-    timeline_html = build_timeline_chart(prs_data, days)
-    comparison_html = build_user_comparison(prs_data)
-
-    # Build filter buttons
-    def btn(label, onclick):
-        return f'<button class="filter-btn" onclick="{onclick}">{label}</button>'
+    </div>""")
+    return "".join(parts)
 
-    filter_buttons = [
-        '<button class="filter-btn active" onclick="filterPRs(\'all\')">All (' + str(total) + ')</button>',
-        btn(f"Active ({active})", "filterPRs('status:active')"),
-        btn(f"Completed ({completed})", "filterPRs('status:completed')"),
-    ]
-    if len(users) > 1:
-        for email, name in users:
-            short = name.split()[0] if " " in name else name
-            count = sum(1 for p in prs_data if p.get("creator_email") == email)
-            filter_buttons.append(btn(f"{escape(short)} ({count})", f"filterByUser('{escape(email)}')"))
-    if len(projects) > 1:
-        for proj in projects:
-            count = sum(1 for p in prs_data if p.get("project_name") == proj)
-            filter_buttons.append(btn(f"{escape(proj)} ({count})", f"filterPRs('project:{escape(proj)}')"))
-    if len(repos) > 1 and len(repos) <= 10:
-        for r in repos:
-            count = sum(1 for p in prs_data if p["repo_name"] == r)
-            filter_buttons.append(btn(f"{escape(r)} ({count})", f"filterPRs('repo:{escape(r)}')"))
 
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="utf-8">
-<meta name="viewport" content="width=device-width, initial-scale=1">
-<title>{escape(title)}</title>
-<style>
-    :root {{
+# Static report stylesheet. Inlined (minified) into every report by default,
+# or written next to it once with --external-css so browsers can cache it.
+_REPORT_CSS = """
+    :root {
         --bg: #0d1117; --surface: #161b22; --border: #30363d;
         --text: #e6edf3; --text-muted: #8b949e; --accent: #58a6ff;
         --green: #3fb950; --red: #f85149; --orange: #d29922; --blue: #58a6ff;
-    }}
-    * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-    body {{
+    }
+    * { box-sizing: border-box; margin: 0; padding: 0; }
+    body {
         font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif;
         background: var(--bg); color: var(--text); line-height: 1.5; padding: 2rem;
-    }}
-    .container {{ max-width: 1060px; margin: 0 auto; }}
-    h1 {{ font-size: 1.8rem; margin-bottom: 0.25rem; }}
-    h2 {{ font-size: 1.3rem; margin-bottom: 1rem; color: var(--text); }}
-    .subtitle {{ color: var(--text-muted); margin-bottom: 1.5rem; font-size: 0.9rem; }}
-    .stats-grid {{
+    }
+    .container { max-width: 1060px; margin: 0 auto; }
+    h1 { font-size: 1.8rem; margin-bottom: 0.25rem; }
+    h2 { font-size: 1.3rem; margin-bottom: 1rem; color: var(--text); }
+    .subtitle { color: var(--text-muted); margin-bottom: 1.5rem; font-size: 0.9rem; }
+    .stats-grid {
         display: grid; grid-template-columns: repeat(auto-fit, minmax(130px, 1fr));
         gap: 1rem; margin-bottom: 2rem;
-    }}
-    .stat-card {{
+    }
+    .stat-card {
         background: var(--surface); border: 1px solid var(--border);
         border-radius: 8px; padding: 1rem; text-align: center;
-    }}
-    .stat-card .number {{ font-size: 2rem; font-weight: 700; }}
-    .stat-card .label {{
+    }
+    .stat-card .number { font-size: 2rem; font-weight: 700; }
+    .stat-card .label {
         color: var(--text-muted); font-size: 0.8rem;
         text-transform: uppercase; letter-spacing: 0.05em;
-    }}
+    }
 
     /* Consumption */
-    .consumption-section {{
+    .consumption-section {
         background: var(--surface); border: 1px solid var(--border);
         border-radius: 8px; padding: 1.25rem; margin-bottom: 2rem;
-    }}
-    .consumption-section canvas {{ width: 100%; }}
-    .cons-stats {{
+    }
+    .consumption-section canvas { width: 100%; }
+    .cons-stats {
         display: flex; gap: 1.5rem; margin-bottom: 1rem; flex-wrap: wrap;
-    }}
-    .cons-stat {{
+    }
+    .cons-stat {
         display: flex; flex-direction: column; align-items: center;
-    }}
-    .cons-num {{ font-size: 1.4rem; font-weight: 700; color: var(--text); }}
-    .cons-label {{ font-size: 0.75rem; color: var(--text-muted); text-transform: uppercase; letter-spacing: 0.04em; }}
-    .cons-filters {{
+    }
+    .cons-num { font-size: 1.4rem; font-weight: 700; color: var(--text); }
+    .cons-label { font-size: 0.75rem; color: var(--text-muted); text-transform: uppercase; letter-spacing: 0.04em; }
+    .cons-filters {
         display: flex; gap: 0.4rem; margin-bottom: 1rem; flex-wrap: wrap;
-    }}
-    .cons-filter {{
+    }
+    .cons-filter {
         background: var(--bg); border: 1px solid var(--border); color: var(--text-muted);
         padding: 0.3rem 0.65rem; border-radius: 14px; cursor: pointer;
         font-size: 0.78rem; transition: all 0.15s;
-    }}
-    .cons-filter:hover {{ color: var(--text); border-color: var(--text-muted); }}
-    .cons-filter.active {{ background: rgba(88,166,255,0.15); color: var(--accent); border-color: var(--accent); }}
-    .cons-legend {{
+    }
+    .cons-filter:hover { color: var(--text); border-color: var(--text-muted); }
+    .cons-filter.active { background: rgba(88,166,255,0.15); color: var(--accent); border-color: var(--accent); }
+    .cons-legend {
         display: flex; gap: 1.5rem; justify-content: center; margin-top: 0.5rem;
         font-size: 0.8rem; color: var(--text-muted);
-    }}
-    .cons-legend-item {{ display: flex; align-items: center; gap: 0.35rem; }}
-    .cons-swatch {{
+    }
+    .cons-legend-item { display: flex; align-items: center; gap: 0.35rem; }
+    .cons-swatch {
         display: inline-block; width: 14px; height: 10px; border-radius: 2px;
-    }}
-    .cons-swatch-line {{
+    }
+    .cons-swatch-line {
         height: 3px; border-radius: 2px;
-    }}
+    }
 
     /* Timeline */
-    .timeline-section {{
+    .timeline-section {
         background: var(--surface); border: 1px solid var(--border);
         border-radius: 8px; padding: 1.25rem; margin-bottom: 2rem;
-    }}
-    .timeline-section canvas {{ width: 100%; }}
+    }
+    .timeline-section canvas { width: 100%; }
 
     /* Comparison */
-    .comparison-section {{
+    .comparison-section {
         background: var(--surface); border: 1px solid var(--border);
         border-radius: 8px; padding: 1.25rem; margin-bottom: 2rem;
-    }}
-    .comparison-grid {{ display: grid; grid-template-columns: 280px 1fr; gap: 1.5rem; align-items: start; }}
-    .bar-chart {{ display: flex; flex-direction: column; gap: 0.5rem; }}
-    .bar-row {{ display: flex; align-items: center; gap: 0.5rem; }}
-    .bar-row:hover .bar-fill {{ opacity: 0.8; }}
-    .bar-label {{ width: 70px; font-size: 0.82rem; text-align: right; color: var(--text-muted); flex-shrink: 0; }}
-    .bar-track {{ flex: 1; background: var(--bg); border-radius: 4px; height: 22px; position: relative; overflow: hidden; }}
-    .bar-fill {{ height: 100%; border-radius: 4px; transition: width 0.3s; min-width: 2px; }}
-    .bar-value {{ position: absolute; right: 6px; top: 1px; font-size: 0.75rem; font-weight: 600; }}
-    .comparison-table-wrap {{ overflow-x: auto; }}
-    .comparison-table {{ width: 100%; border-collapse: collapse; font-size: 0.85rem; }}
-    .comparison-table th {{
+    }
+    .comparison-grid { display: grid; grid-template-columns: 280px 1fr; gap: 1.5rem; align-items: start; }
+    .bar-chart { display: flex; flex-direction: column; gap: 0.5rem; }
+    .bar-row { display: flex; align-items: center; gap: 0.5rem; }
+    .bar-row:hover .bar-fill { opacity: 0.8; }
+    .bar-label { width: 70px; font-size: 0.82rem; text-align: right; color: var(--text-muted); flex-shrink: 0; }
+    .bar-track { flex: 1; background: var(--bg); border-radius: 4px; height: 22px; position: relative; overflow: hidden; }
+    .bar-fill { height: 100%; border-radius: 4px; transition: width 0.3s; min-width: 2px; }
+    .bar-value { position: absolute; right: 6px; top: 1px; font-size: 0.75rem; font-weight: 600; }
+    .comparison-table-wrap { overflow-x: auto; }
+    .comparison-table { width: 100%; border-collapse: collapse; font-size: 0.85rem; }
+    .comparison-table th {
         text-align: left; padding: 0.5rem 0.6rem; border-bottom: 1px solid var(--border);
         color: var(--text-muted); font-weight: 600; font-size: 0.75rem; text-transform: uppercase;
-    }}
-    .comparison-table td {{ padding: 0.5rem 0.6rem; border-bottom: 1px solid rgba(48,54,61,0.5); }}
-    .comparison-table .num {{ text-align: center; }}
-    .user-row:hover {{ background: rgba(88,166,255,0.05); }}
-    .user-dot {{ display: inline-block; width: 8px; height: 8px; border-radius: 50%; margin-right: 6px; vertical-align: middle; }}
+    }
+    .comparison-table td { padding: 0.5rem 0.6rem; border-bottom: 1px solid rgba(48,54,61,0.5); }
+    .comparison-table .num { text-align: center; }
+    .user-row:hover { background: rgba(88,166,255,0.05); }
+    .user-dot { display: inline-block; width: 8px; height: 8px; border-radius: 50%; margin-right: 6px; vertical-align: middle; }
 
     /* Filters */
-    .filter-bar {{ display: flex; gap: 0.5rem; margin-bottom: 1.5rem; flex-wrap: wrap; }}
-    .filter-btn {{
+    .filter-bar { display: flex; gap: 0.5rem; margin-bottom: 1.5rem; flex-wrap: wrap; }
+    .filter-btn {
         background: var(--surface); border: 1px solid var(--border); color: var(--text);
         padding: 0.4rem 0.8rem; border-radius: 20px; cursor: pointer;
         font-size: 0.82rem; transition: all 0.15s;
-    }}
-    .filter-btn:hover, .filter-btn.active {{
+    }
+    .filter-btn:hover, .filter-btn.active {
         background: var(--accent); color: var(--bg); border-color: var(--accent);
-    }}
+    }
 
     /* PR Cards */
-    .pr-card {{
+    .pr-card {
         background: var(--surface); border: 1px solid var(--border);
         border-radius: 8px; margin-bottom: 0.75rem; overflow: hidden; transition: border-color 0.15s;
-    }}
-    .pr-card:hover {{ border-color: var(--accent); }}
-    .pr-header {{
+        /* Skip layout/paint of off-screen cards; the estimate keeps the scrollbar sane */
+        content-visibility: auto; contain-intrinsic-size: auto 160px;
+    }
+    .pr-card:hover { border-color: var(--accent); }
+    .pr-header {
         padding: 0.85rem 1.1rem; display: flex; justify-content: space-between;
         align-items: flex-start; gap: 0.75rem;
-    }}
-    .pr-title {{
+    }
+    .pr-title {
         color: var(--accent); text-decoration: none; font-weight: 600;
         font-size: 1rem; line-height: 1.3;
-    }}
-    .pr-title:hover {{ text-decoration: underline; }}
-    .pr-meta {{ display: flex; align-items: center; gap: 0.4rem; flex-shrink: 0; flex-wrap: wrap; }}
-    .badge {{
+    }
+    .pr-title:hover { text-decoration: underline; }
+    .pr-meta { display: flex; align-items: center; gap: 0.4rem; flex-shrink: 0; flex-wrap: wrap; }
+    .badge {
         color: #fff; padding: 0.12rem 0.45rem; border-radius: 12px;
         font-size: 0.72rem; font-weight: 600; text-transform: uppercase;
-    }}
-    .pr-id {{ color: var(--text-muted); font-size: 0.82rem; }}
-    .pr-repo {{
+    }
+    .pr-id { color: var(--text-muted); font-size: 0.82rem; }
+    .pr-repo {
         color: var(--text-muted); font-size: 0.78rem;
         background: var(--bg); padding: 0.1rem 0.4rem; border-radius: 4px;
-    }}
-    .pr-creator {{
+    }
+    .pr-creator {
         color: var(--accent); font-size: 0.78rem; font-weight: 500;
         background: rgba(88,166,255,0.1); padding: 0.1rem 0.4rem; border-radius: 4px;
-    }}
-    .pr-details {{ padding: 0 1.1rem 0.85rem; display: flex; flex-direction: column; gap: 0.4rem; }}
-    .pr-branches code {{
+    }
+    .pr-details { padding: 0 1.1rem 0.85rem; display: flex; flex-direction: column; gap: 0.4rem; }
+    .pr-branches code {
         background: rgba(88,166,255,0.15); color: var(--accent);
         padding: 0.1rem 0.4rem; border-radius: 4px; font-size: 0.8rem;
-    }}
-    .pr-dates {{ display: flex; gap: 1.5rem; color: var(--text-muted); font-size: 0.8rem; }}
-    .pr-desc {{
+    }
+    .pr-dates { display: flex; gap: 1.5rem; color: var(--text-muted); font-size: 0.8rem; }
+    .pr-desc {
         color: var(--text-muted); font-size: 0.82rem; white-space: pre-line;
         max-height: 100px; overflow-y: auto; padding: 0.4rem;
         background: var(--bg); border-radius: 6px; border: 1px solid var(--border);
-    }}
-    .reviewers {{ display: flex; flex-wrap: wrap; gap: 0.35rem; }}
-    .reviewer {{
+    }
+    .reviewers { display: flex; flex-wrap: wrap; gap: 0.35rem; }
+    .reviewer {
         font-size: 0.8rem; padding: 0.12rem 0.45rem; border-radius: 12px;
         background: var(--bg); border: 1px solid var(--border);
-    }}
-    .vote-approved {{ color: var(--green); border-color: var(--green); }}
-    .vote-approved-suggest {{ color: #3fb950; border-color: #2ea04366; }}
-    .vote-wait {{ color: var(--orange); border-color: var(--orange); }}
-    .vote-rejected {{ color: var(--red); border-color: var(--red); }}
-    .vote-none {{ color: var(--text-muted); }}
-    .work-items {{ font-size: 0.8rem; color: var(--text-muted); }}
-    .pr-stats {{ display: flex; gap: 0.75rem; font-size: 0.8rem; }}
-    .stat-add {{ color: var(--green); }}
-    .stat-edit {{ color: var(--orange); }}
-    .stat-del {{ color: var(--red); }}
-    .files-section {{ font-size: 0.8rem; }}
-    .files-section summary {{ cursor: pointer; color: var(--text-muted); padding: 0.25rem 0; }}
-    .files-section summary:hover {{ color: var(--accent); }}
-    .file-table {{ width: 100%; border-collapse: collapse; margin-top: 0.25rem; }}
-    .file-table tr:hover {{ background: rgba(255,255,255,0.03); }}
-    .file-change {{ width: 24px; text-align: center; font-weight: 700; padding: 0.15rem 0.35rem; }}
-    .file-add {{ color: var(--green); }}
-    .file-edit {{ color: var(--orange); }}
-    .file-delete {{ color: var(--red); }}
-    .file-path {{
+    }
+    .vote-approved { color: var(--green); border-color: var(--green); }
+    .vote-approved-suggest { color: #3fb950; border-color: #2ea04366; }
+    .vote-wait { color: var(--orange); border-color: var(--orange); }
+    .vote-rejected { color: var(--red); border-color: var(--red); }
+    .vote-none { color: var(--text-muted); }
+    .work-items { font-size: 0.8rem; color: var(--text-muted); }
+    .pr-stats { display: flex; gap: 0.75rem; font-size: 0.8rem; }
+    .stat-add { color: var(--green); }
+    .stat-edit { color: var(--orange); }
+    .stat-del { color: var(--red); }
+    .files-section { font-size: 0.8rem; }
+    .files-section summary { cursor: pointer; color: var(--text-muted); padding: 0.25rem 0; }
+    .files-section summary:hover { color: var(--accent); }
+    .file-table { width: 100%; border-collapse: collapse; margin-top: 0.25rem; }
+    .file-table tr:hover { background: rgba(255,255,255,0.03); }
+    .file-change { width: 24px; text-align: center; font-weight: 700; padding: 0.15rem 0.35rem; }
+    .file-add { color: var(--green); }
+    .file-edit { color: var(--orange); }
+    .file-delete { color: var(--red); }
+    .file-path {
         padding: 0.15rem 0.35rem;
         font-family: 'SF Mono', SFMono-Regular, Consolas, 'Liberation Mono', Menlo, monospace;
         font-size: 0.75rem; color: var(--text-muted);
-    }}
-    .empty-state {{ text-align: center; padding: 3rem; color: var(--text-muted); }}
-    .footer {{
+    }
+    .empty-state { text-align: center; padding: 3rem; color: var(--text-muted); }
+    .footer {
         text-align: center; color: var(--text-muted); font-size: 0.75rem;
         margin-top: 2rem; padding-top: 1rem; border-top: 1px solid var(--border);
-    }}
-    #pr-count {{ color: var(--text-muted); font-size: 0.85rem; margin-bottom: 0.75rem; }}
-    @media (max-width: 768px) {{
-        body {{ padding: 1rem; }}
-        .pr-header {{ flex-direction: column; }}
-        .pr-dates {{ flex-direction: column; gap: 0.2rem; }}
-        .stats-grid {{ grid-template-columns: repeat(2, 1fr); }}
-        .comparison-grid {{ grid-template-columns: 1fr; }}
-    }}
-</style>
+    }
+    #pr-count { color: var(--text-muted); font-size: 0.85rem; margin-bottom: 0.75rem; }
+    @media (max-width: 768px) {
+        body { padding: 1rem; }
+        .pr-header { flex-direction: column; }
+        .pr-dates { flex-direction: column; gap: 0.2rem; }
+        .stats-grid { grid-template-columns: repeat(2, 1fr); }
+        .comparison-grid { grid-template-columns: 1fr; }
+    }
+"""
+
+
+def _minify_css(css: str) -> str:
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r" ?([{}:;,>]) ?", r"\1", css).strip()
+
+
+_REPORT_CSS_MIN = _minify_css(_REPORT_CSS)
+
+
+def _css_string(value: str) -> str:
+    """Quote `value` as a CSS string, safe inside an inline <style>."""
+    return '"' + re.sub(r'[\\"<\n\r\f]', lambda m: f"\\{ord(m.group()):x} ", value) + '"'
+
+
+def write_report_css(path: Path) -> None:
+    """Write the stylesheet for --external-css, leaving an identical file untouched."""
+    try:
+        if path.read_text(encoding="utf-8") == _REPORT_CSS_MIN:
+            return
+    except OSError:
+        pass
+    path.write_text(_REPORT_CSS_MIN, encoding="utf-8")
+
+
+def write_html(out: TextIO, prs_data: list[dict], title: str, subtitle: str, org: str,
+               days: int = 30, usage: tuple[list[str], list[str], list[float]] | None = None,
+               people: dict | None = None, css_href: str | None = None) -> None:
+    """Write the full HTML report to `out`, streaming each section and PR card as it is built.
+
+    With `css_href` the stylesheet is linked rather than inlined.
+    """
+    now = datetime.now(timezone.utc).strftime("%b %d, %Y %H:%M UTC")
+
+    # One pass over the PRs: PR counts per filter key (the status and button
+    # counts) plus the distinct users, repos, projects
+    total = len(prs_data)
+    total_files = 0
+    users, repos, projects = set(), set(), set()
+    # The status buttons are always shown, so their keys must exist even at 0
+    filter_counts = Counter({"status:active": 0, "status:completed": 0})
+    for p in prs_data:
+        email = p.get("creator_email", "")
+        project = p.get("project_name", "")
+        repo = p["repo_name"]
+        total_files += len(p.get("files", []))
+        # Raw values lead each tuple so sorting is by the unescaped text
+        users.add((email, p["creator_name"], p["creator_email_html"], p["creator_name_html"]))
+        projects.add((project, p["project_name_html"]))
+        repos.add((repo, p["repo_name_html"]))
+        filter_counts["status:" + p["status"]] += 1
+        filter_counts["user:" + email] += 1
+        filter_counts["project:" + project] += 1
+        filter_counts["repo:" + repo] += 1
+    completed = filter_counts["status:completed"]
+    active = filter_counts["status:active"]
+    users, repos, projects = sorted(users), sorted(repos), sorted(projects)
+
+    # Each filter key gets a body class and one rule hiding the cards whose
+    # data-* attribute doesn't match, so filtering is a single class change
+    filter_rules = []
+    filter_map = {}
+    for i, (key, count) in enumerate(filter_counts.items()):
+        attr, value = key.split(":", 1)
+        filter_rules.append(f'.f{i} .pr-card:not([data-{attr}={_css_string(value)}]){{display:none}}')
+        filter_map[key] = [f"f{i}", count]
+    # Any key without an entry matches no PR
+    filter_rules.append(".fnone .pr-card{display:none}")
+    # Names and emails are user data; keep them from closing the <script> early
+    filter_map_json = _json_dumps(filter_map).replace("</", "<\\/")
+
+    # Build filter buttons
+    def btn(label, onclick):
+        return f'<button class="filter-btn" onclick="{onclick}">{label}</button>'
+
+    filter_buttons = [
+        '<button class="filter-btn active" onclick="filterPRs(\'all\')">All (' + str(total) + ')</button>',
+        btn(f"Active ({active})", "filterPRs('status:active')"),
+        btn(f"Completed ({completed})", "filterPRs('status:completed')"),
+    ]
+    if len(users) > 1:
+        for email, _, email_html, name_html in users:
+            short = name_html.split()[0] if " " in name_html else name_html
+            count = filter_counts["user:" + email]
+            filter_buttons.append(btn(f"{short} ({count})", f"filterByUser('{email_html}')"))
+    if len(projects) > 1:
+        for proj, proj_html in projects:
+            count = filter_counts["project:" + proj]
+            filter_buttons.append(btn(f"{proj_html} ({count})", f"filterPRs('project:{proj_html}')"))
+    if len(repos) > 1 and len(repos) <= 10:
+        for r, r_html in repos:
+            count = filter_counts["repo:" + r]
+            filter_buttons.append(btn(f"{r_html} ({count})", f"filterPRs('repo:{r_html}')"))
+
+    if css_href:
+        head_css = f'<link rel="stylesheet" href="{escape(css_href)}">'
+    else:
+        head_css = f"<style>{_REPORT_CSS_MIN}</style>"
+
+    out.write(f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{escape(title)}</title>
+{head_css}
+<style>{"".join(filter_rules)}</style>
 </head>
 <body>
 <div class="container">
@@ -1259,19 +1647,34 @@ def generate_html(prs_data: list[dict], title: str, subtitle: str, org: str,
         </div>
     </div>
 
-    {consumption_html}
-
-    {timeline_html}
+    """)
 
-    {comparison_html}
+    # Each section is written as soon as it is built; nothing holds the whole
+    # document in memory
+    out.write(build_consumption_chart(prs_data, usage, days, people=people))
+    out.write("\n\n    ")
+    out.write(build_timeline_chart(prs_data, days))
+    out.write("\n\n    ")
+    out.write(build_user_comparison(prs_data))
+    out.write("""
 
     <div class="filter-bar">
-        {"".join(filter_buttons)}
+        """)
+    out.writelines(filter_buttons)
+    out.write("""
     </div>
 
     <div id="pr-count"></div>
     <div id="pr-list">
-        {pr_cards}
+        """)
+
+    if prs_data:
+        for pr in prs_data:
+            out.writelines(build_pr_card(pr))
+    else:
+        out.write('<div class="empty-state">No pull requests found for this period.</div>')
+
+    out.write(f"""
     </div>
 
     <div class="footer">
@@ -1279,26 +1682,14 @@ def generate_html(prs_data: list[dict], title: str, subtitle: str, org: str,
     </div>
 </div>
 <script>
+// filter key -> [body class, matching PR count]; the per-class rules in the
+// head do the hiding, so a filter change is one className write
+const FILTERS = {filter_map_json};
 function filterPRs(filter) {{
     document.querySelectorAll('.filter-btn').forEach(b => b.classList.remove('active'));
     if (event && event.target) event.target.classList.add('active');
-    let shown = 0;
-    document.querySelectorAll('.pr-card').forEach(card => {{
-        let show = true;
-        if (filter === 'all') {{
-            show = true;
-        }} else if (filter.startsWith('status:')) {{
-            show = card.dataset.status === filter.slice(7);
-        }} else if (filter.startsWith('repo:')) {{
-            show = card.dataset.repo === filter.slice(5);
-        }} else if (filter.startsWith('user:')) {{
-            show = card.dataset.user === filter.slice(5);
-        }} else if (filter.startsWith('project:')) {{
-            show = card.dataset.project === filter.slice(8);
-        }}
-        card.style.display = show ? '' : 'none';
-        if (show) shown++;
-    }});
+    const [cls, shown] = filter === 'all' ? ['', {total}] : (FILTERS[filter] || ['fnone', 0]);
+    document.body.className = cls;
     document.getElementById('pr-count').textContent = 'Showing ' + shown + ' of {total} PRs';
 }}
 function filterByUser(email) {{
@@ -1307,40 +1698,45 @@ function filterByUser(email) {{
 }}
 </script>
 </body>
-</html>"""
+</html>""")
 
 
 # ── Main ─────────────────────────────────────────────────────────────────────
 
 
-def enrich_pr(pr: dict, org: str, token: str | None, fetch_files: bool) -> dict:
-    """Convert raw PR to display dict, optionally fetching files."""
+def fetch_pr_files(pr: dict, org: str, token: str) -> list[dict]:
+    """Fetch the changed files of a raw PR's latest iteration."""
+    repo = pr.get("repository", {})
+    project_id = repo.get("project", {}).get("id", "")
+    changes = fetch_pr_changes(org, project_id, repo.get("id", ""), pr["pullRequestId"], token)
+    files = []
+    for c in changes:
+        path = c.get("item", {}).get("path", "")
+        if path and not path.endswith("/"):
+            files.append({"path": path, "type": c.get("changeType", "edit")})
+    return files
+
+
+def fetch_pr_diff_stats(pr: dict, org: str, token: str) -> dict:
+    """Fetch add/edit/delete counts between a raw PR's merge source and target."""
+    repo = pr.get("repository", {})
+    project_id = repo.get("project", {}).get("id", "")
+    source = pr.get("lastMergeSourceCommit", {}).get("commitId", "")
+    target = pr.get("lastMergeTargetCommit", {}).get("commitId", "")
+    return fetch_diff_stats(org, project_id, repo.get("id", ""), source, target, token)
+
+
+_WORK_ITEM_RE = re.compile(r"#(\d{5,})")
+
+
+def enrich_pr(pr: dict, org: str, files: list[dict], diff_stats: dict,
+              now: datetime | None = None) -> dict:
+    """Convert raw PR plus its fetched file changes to a display dict."""
     repo = pr.get("repository", {})
-    repo_id = repo.get("id", "")
     repo_name = repo.get("name", "unknown")
-    project_info = repo.get("project", {})
-    project_id = project_info.get("id", "")
-    project_name = project_info.get("name", "")
+    project_name = repo.get("project", {}).get("name", "")
     pr_id = pr["pullRequestId"]
 
-    files = []
-    diff_stats = {}
-    if token and fetch_files:
-        try:
-            changes = fetch_pr_changes(org, project_id, repo_id, pr_id, token)
-            for c in changes:
-                path = c.get("item", {}).get("path", "")
-                if path and not path.endswith("/"):
-                    files.append({"path": path, "type": c.get("changeType", "edit")})
-        except Exception:
-            pass
-        try:
-            source = pr.get("lastMergeSourceCommit", {}).get("commitId", "")
-            target = pr.get("lastMergeTargetCommit", {}).get("commitId", "")
-            diff_stats = fetch_diff_stats(org, project_id, repo_id, source, target, token)
-        except Exception:
-            pass
-
     reviewers = [{"name": r.get("displayName", "?"), "vote": r.get("vote", 0)}
                  for r in pr.get("reviewers", [])]
 
@@ -1348,10 +1744,19 @@ def enrich_pr(pr: dict, org: str, token: str | None, fetch_files: bool) -> dict:
     merge_msg = ""
     if pr.get("completionOptions"):
         merge_msg = pr["completionOptions"].get("mergeCommitMessage", "") or ""
-    work_items = list(set(re.findall(r"#(\d{5,})", f"{desc} {merge_msg}")))
+    work_items = set(_WORK_ITEM_RE.findall(desc))
+    if merge_msg:
+        work_items.update(_WORK_ITEM_RE.findall(merge_msg))
+    work_items = list(work_items)
 
     created_by = pr.get("createdBy", {})
+    creator_name = created_by.get("displayName", "")
+    creator_email = created_by.get("uniqueName", "")
+    desc = desc[:500]
+    card_desc = desc[:400] + "..." if len(desc) > 400 else desc
 
+    # Fields rendered in several places are escaped once here; the *_html
+    # variants are what the card, comparison and filter builders emit
     return {
         "pr_id": pr_id,
         "title": pr.get("title", "Untitled"),
@@ -1359,19 +1764,25 @@ def enrich_pr(pr: dict, org: str, token: str | None, fetch_files: bool) -> dict:
         "url": pr_url(org, project_name, repo_name, pr_id),
         "repo_name": repo_name,
         "project_name": project_name,
-        "creator_name": created_by.get("displayName", ""),
-        "creator_email": created_by.get("uniqueName", ""),
+        "creator_name": creator_name,
+        "creator_email": creator_email,
         "source_branch": branch_name(pr.get("sourceRefName")),
         "target_branch": branch_name(pr.get("targetRefName")),
         "created": format_date(pr.get("creationDate")),
-        "created_ago": days_ago(pr.get("creationDate")),
+        "created_day": utc_day(pr.get("creationDate")),
+        "created_ago": days_ago(pr.get("creationDate"), now),
         "closed": format_date(pr.get("closedDate")),
-        "closed_ago": days_ago(pr.get("closedDate")),
-        "description": desc[:500],
+        "closed_ago": days_ago(pr.get("closedDate"), now),
+        "description": desc,
         "reviewers": reviewers,
         "files": files,
         "diff_stats": diff_stats,
         "work_items": work_items,
+        "repo_name_html": escape(repo_name),
+        "project_name_html": escape(project_name),
+        "creator_name_html": escape(creator_name),
+        "creator_email_html": escape(creator_email),
+        "description_html": escape(card_desc),
     }
 
 
@@ -1384,17 +1795,21 @@ def main():
     parser.add_argument("--output", "-o", help="Output HTML file")
     parser.add_argument("--no-files", action="store_true", help="Skip fetching per-PR file changes (faster)")
     parser.add_argument("--all", action="store_true", help="Fetch all users across all (or specified) projects")
-    parser.add_argument("--workers", type=int, default=6, help="Concurrent workers for fetching (default: 6)")
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent workers for fetching (default: 16)")
     parser.add_argument("--anthropic-key", help="Anthropic admin API key for consumption data")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk cache of az defaults and API key names")
+    parser.add_argument("--external-css", metavar="FILE",
+                        help="Write the stylesheet to FILE next to the report and link it instead of inlining")
     args = parser.parse_args()
 
-    defaults = get_defaults()
+    defaults = get_defaults(use_cache=not args.no_cache)
     org = args.org or defaults.get("organization", "")
     if not org:
         print("ERROR: Organization required. Set via --org or az devops configure.", file=sys.stderr)
         sys.exit(1)
 
-    cutoff = datetime.now(timezone.utc) - timedelta(days=args.days)
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=args.days)
 
     # Determine which projects to scan
     if args.project:
@@ -1472,31 +1887,38 @@ def main():
     # Sort by creation date descending
     all_prs.sort(key=lambda p: p.get("creationDate", ""), reverse=True)
 
-    # Enrich PRs with file changes (concurrent)
+    # Fetch file changes and diff stats (concurrent). The changes chain and
+    # the diff call are independent, so they go on the pool as separate tasks.
+    # Each PR is enriched as soon as both of its fetches are in, so the
+    # (GIL-bound) formatting runs while the pool threads wait on the network.
     token = get_token() if not args.no_files and all_prs else None
-    fetch_files = not args.no_files
-
-    print(f"  Enriching {len(all_prs)} PRs{'  (fetching files)' if fetch_files else ''}...")
-    prs_data = []
-
-    def enrich(pr):
-        return enrich_pr(pr, org, token, fetch_files)
-
-    with ThreadPoolExecutor(max_workers=args.workers) as pool:
-        futures = {pool.submit(enrich, pr): i for i, pr in enumerate(all_prs)}
-        results = [None] * len(all_prs)
-        done = 0
-        for future in as_completed(futures):
-            idx = futures[future]
-            done += 1
-            try:
-                results[idx] = future.result()
-            except Exception as e:
-                print(f"    Warning: PR enrichment failed: {e}", file=sys.stderr)
-            if done % 10 == 0 or done == len(all_prs):
-                print(f"    [{done}/{len(all_prs)}]")
-
-    prs_data = [r for r in results if r is not None]
+    files_by_pr = [[] for _ in all_prs]
+    diffs_by_pr = [{} for _ in all_prs]
+    prs_data = [None] * len(all_prs)
+
+    print(f"  Enriching {len(all_prs)} PRs{'  (fetching files)' if token else ''}...")
+    if token:
+        pending = [2] * len(all_prs)
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            futures = {}
+            for i, pr in enumerate(all_prs):
+                futures[pool.submit(fetch_pr_files, pr, org, token)] = (files_by_pr, i)
+                futures[pool.submit(fetch_pr_diff_stats, pr, org, token)] = (diffs_by_pr, i)
+            done = 0
+            for future in as_completed(futures):
+                results, idx = futures[future]
+                done += 1
+                try:
+                    results[idx] = future.result()
+                except Exception as e:
+                    print(f"    Warning: PR fetch failed: {e}", file=sys.stderr)
+                pending[idx] -= 1
+                if not pending[idx]:
+                    prs_data[idx] = enrich_pr(all_prs[idx], org, files_by_pr[idx], diffs_by_pr[idx], now)
+                if done % 20 == 0 or done == len(futures):
+                    print(f"    [{done}/{len(futures)}]")
+    else:
+        prs_data = [enrich_pr(pr, org, [], {}, now) for pr in all_prs]
 
     # Generate report
     if args.all:
@@ -1513,11 +1935,11 @@ def main():
         default_output = "reports/pr-report.html"
 
     # Fetch Anthropic usage if key provided
-    usage_buckets = None
+    usage = None
     people = None
     if args.anthropic_key:
         print("\n  Fetching Anthropic API key list...")
-        key_map = fetch_api_keys(args.anthropic_key)
+        key_map = fetch_api_keys(args.anthropic_key, use_cache=not args.no_cache)
         print(f"  Found {len(key_map)} API keys")
 
         if key_map:
@@ -1531,21 +1953,24 @@ def main():
         print("  Fetching Anthropic API usage data...")
         usage_buckets = fetch_anthropic_usage(args.anthropic_key, args.days)
         if usage_buckets:
-            total_cost = sum(
-                _calc_cost(r)
-                for b in usage_buckets for r in b.get("results", [])
-            )
+            usage = flatten_usage(usage_buckets)
+            total_cost = sum(usage[2])
             print(f"  Got {len(usage_buckets)} daily buckets, ${total_cost:,.2f} total estimated cost")
         else:
             print("  No usage data returned (check key permissions)")
 
-    html = generate_html(prs_data, title, subtitle, org, days=args.days,
-                         usage_buckets=usage_buckets, people=people)
-
     output_path = args.output or default_output
     output = Path(output_path)
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(html, encoding="utf-8")
+    css_href = None
+    if args.external_css:
+        css_path = output.parent / args.external_css
+        css_path.parent.mkdir(parents=True, exist_ok=True)
+        write_report_css(css_path)
+        css_href = Path(args.external_css).as_posix()
+    with output.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        write_html(f, prs_data, title, subtitle, org, days=args.days,
+                   usage=usage, people=people, css_href=css_href)
     print(f"\nReport saved to {output.resolve()}")
 
 
@@ -34,12 +34,35 @@ Usage:
 """
 
 import argparse
+import gzip
+import http.client
+import io
 import json
+import os
+import re
 import subprocess
 import sys
-from collections import defaultdict
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from urllib.parse import quote, urlencode, urlsplit
+
+try:
+    import orjson  # optional: parses straight from bytes, several times faster
+except ImportError:
+    orjson = None
+
+if orjson:
+    _json_loads = orjson.loads
+else:
+    def _json_loads(data: str | bytes):
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        return json.loads(data)
 
 
 # ── Azure DevOps ──────────────────────────────────────────────────────────────
@@ -54,7 +77,34 @@ def run_az(args: list[str], timeout: int = 30) -> str:
     return result.stdout.strip()
 
 
-def get_devops_defaults() -> dict:
+CACHE_DIR = Path.home() / ".cache" / "time-report"
+_CACHE_TTL = 86400
+
+
+def _cached_json(path: Path, ttl_seconds: float, producer, use_cache: bool = True):
+    """Return the JSON cached at `path` if younger than `ttl_seconds`, else call
+    `producer()` and store its result. With `use_cache=False` the cached value is
+    ignored but refreshed. Empty results are not cached."""
+    if use_cache:
+        try:
+            if time.time() - path.stat().st_mtime < ttl_seconds:
+                return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+    value = producer()
+    if value:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    return value
+
+
+def _read_devops_defaults() -> dict:
     output = run_az(["devops", "configure", "--list"])
     defaults = {}
     for line in output.splitlines():
@@ -64,25 +114,225 @@ def get_devops_defaults() -> dict:
     return defaults
 
 
-def fetch_devops_prs(org: str, project: str, status: str,
-                     creator: str | None = None) -> list[dict]:
+def get_devops_defaults(use_cache: bool = True) -> dict:
+    """Return `az devops configure` defaults, cached on disk for a day."""
+    return _cached_json(CACHE_DIR / "defaults.json", _CACHE_TTL, _read_devops_defaults, use_cache)
+
+
+def get_account_user(use_cache: bool = True) -> str:
+    """Return the signed-in az user name, cached on disk for a day."""
+    return _cached_json(
+        CACHE_DIR / "account.json", _CACHE_TTL,
+        lambda: run_az(["account", "show", "--query", "user.name", "-o", "tsv"]),
+        use_cache,
+    )
+
+
+_DEVOPS_RESOURCE = "499b84ac-1321-427f-aa17-267ca6975798"
+_GRAPH_RESOURCE = "https://graph.microsoft.com"
+
+_TOKEN_LOCK = threading.Lock()
+_TOKENS: dict[str, tuple[str, float]] = {}  # resource -> (token, time.monotonic() expiry)
+
+
+def _token_lifetime(data: dict) -> float:
+    """Seconds until a get-access-token result expires (0 if unknown)."""
+    if data.get("x"):
+        # expires_on: POSIX timestamp, az >= 2.54
+        return float(data["x"]) - time.time()
+    try:
+        # expiresOn: naive local time
+        return datetime.fromisoformat(data.get("e") or "").timestamp() - time.time()
+    except ValueError:
+        return 0.0
+
+
+def get_token(resource: str) -> str:
+    """Return an access token for `resource`, cached in-process until shortly before expiry."""
+    with _TOKEN_LOCK:
+        cached = _TOKENS.get(resource)
+        if cached and time.monotonic() < cached[1] - 60:
+            return cached[0]
+        output = run_az(["account", "get-access-token", "--resource", resource,
+                         "--query", "{t:accessToken,e:expiresOn,x:expires_on}", "-o", "json"])
+        data = _json_loads(output) if output else {}
+        _TOKENS[resource] = (data["t"], time.monotonic() + _token_lifetime(data))
+        return data["t"]
+
+
+_HTTP_LOCAL = threading.local()
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def http_get(url: str, headers: dict, timeout: float = 20.0, retries: int = 2) -> tuple[int, bytes]:
+    """GET a URL over a keep-alive connection reused per thread and host.
+
+    Bodies are requested gzip-compressed and transparently decompressed.
+    Dropped connections and 429/5xx responses are retried with a short backoff.
+    Returns (status, body).
+    """
+    headers = {**headers, "Accept-Encoding": "gzip"}
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    conns = getattr(_HTTP_LOCAL, "conns", None)
+    if conns is None:
+        conns = _HTTP_LOCAL.conns = {}
+    key = (parts.scheme, parts.netloc)
+
+    for attempt in range(retries + 1):
+        conn = conns.get(key)
+        if conn is None:
+            conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+            conn = conns[key] = conn_cls(parts.netloc, timeout=timeout)
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (http.client.HTTPException, OSError):
+            # Stale keep-alive socket or network hiccup: reconnect and retry
+            conn.close()
+            del conns[key]
+            if attempt == retries:
+                raise
+            continue
+        if resp.status in _RETRY_STATUSES and attempt < retries:
+            time.sleep(0.2 * 2 ** attempt)
+            continue
+        if resp.getheader("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return resp.status, body
+
+
+def api_get(url: str, resource: str) -> dict | None:
+    """GET a JSON REST endpoint with a bearer token for `resource`.
+
+    Returns None if the token, the request or the response is unusable, so
+    callers can fall back to the az CLI.
+    """
+    try:
+        token = get_token(resource)
+        status, body = http_get(url, {"Authorization": f"Bearer {token}",
+                                      "Accept": "application/json"})
+        if not 200 <= status < 300:
+            return None
+        return _json_loads(body)
+    except (RuntimeError, KeyError, ValueError, subprocess.TimeoutExpired,
+            http.client.HTTPException, OSError):
+        return None
+
+
+_IDENTITY_LOCK = threading.Lock()
+_IDENTITY_CACHE: dict[tuple[str, str], str | None] = {}
+
+
+def _identities_url(org: str) -> str:
+    """Map an org URL to its identity (vssps) service URL."""
+    org = org.rstrip("/")
+    if "://dev.azure.com/" in org:
+        return org.replace("://dev.azure.com/", "://vssps.dev.azure.com/")
+    return org.replace(".visualstudio.com", ".vssps.visualstudio.com")
+
+
+def resolve_identity_id(org: str, email: str) -> str | None:
+    """Resolve a user email to its Azure DevOps identity id (cached per run)."""
+    key = (org, email.lower())
+    with _IDENTITY_LOCK:
+        if key not in _IDENTITY_CACHE:
+            url = (f"{_identities_url(org)}/_apis/identities"
+                   f"?searchFilter=General&filterValue={quote(email)}&api-version=7.1")
+            matches = (api_get(url, _DEVOPS_RESOURCE) or {}).get("value", [])
+            _IDENTITY_CACHE[key] = matches[0]["id"] if matches else None
+        return _IDENTITY_CACHE[key]
+
+
+_PR_PAGE_SIZE = 1000
+
+
+def _slim_pr(pr: dict) -> dict:
+    """Keep only the PR fields get_devops_activity reads; the full payload
+    carries reviewers, links and commit ids for every PR."""
+    return {
+        "repository": {"name": (pr.get("repository") or {}).get("name", "?")},
+        "pullRequestId": pr["pullRequestId"],
+        "title": pr.get("title", "Untitled"),
+        "status": pr.get("status", "?"),
+        "targetRefName": pr.get("targetRefName"),
+        "creationDate": pr.get("creationDate", ""),
+        "closedDate": pr.get("closedDate", ""),
+    }
+
+
+def _fetch_prs_rest(org: str, project: str, status: str, creator: str | None,
+                    time_range: tuple[str, datetime, datetime] | None) -> list[dict] | None:
+    """Fetch all matching PRs via the REST API, page by page; None if any
+    call could not be made."""
+    params = {"searchCriteria.status": status, "$top": _PR_PAGE_SIZE, "api-version": "7.1"}
+    if time_range:
+        kind, start, end = time_range
+        params["searchCriteria.queryTimeRangeType"] = kind
+        params["searchCriteria.minTime"] = start.strftime("%Y-%m-%dT%H:%M:%SZ")
+        params["searchCriteria.maxTime"] = end.strftime("%Y-%m-%dT%H:%M:%SZ")
+    if creator:
+        creator_id = resolve_identity_id(org, creator)
+        if not creator_id:
+            return None
+        params["searchCriteria.creatorId"] = creator_id
+    base = f"{org.rstrip('/')}/{quote(project)}/_apis/git/pullrequests"
+    prs = []
+    while True:
+        params["$skip"] = len(prs)
+        data = api_get(f"{base}?{urlencode(params, safe='$')}", _DEVOPS_RESOURCE)
+        if not data or "value" not in data:
+            return None
+        prs.extend(map(_slim_pr, data["value"]))
+        if len(data["value"]) < _PR_PAGE_SIZE:
+            return prs
+
+
+def fetch_devops_prs(org: str, project: str, status: str = "all",
+                     creator: str | None = None,
+                     time_range: tuple[str, datetime, datetime] | None = None) -> list[dict]:
+    """Fetch every PR with `status` ("all" by default) over REST on the shared
+    connection pool, falling back to `az repos pr list` if the REST call fails.
+
+    `time_range` is ("created" | "closed", start, end) and narrows the REST
+    query server-side; the az fallback ignores it and returns everything.
+    """
+    prs = _fetch_prs_rest(org, project, status, creator, time_range)
+    if prs is not None:
+        return prs
+    return _fetch_prs_az(org, project, status, creator)
+
+
+def _fetch_prs_az(org: str, project: str, status: str, creator: str | None) -> list[dict]:
+    """Fetch every PR with `status` via `az repos pr list`, page by page."""
     args = [
         "repos", "pr", "list", "--status", status,
-        "--top", "200", "--org", org, "--project", project, "-o", "json",
+        "--top", str(_PR_PAGE_SIZE), "--org", org, "--project", project, "-o", "json",
     ]
     if creator:
         args += ["--creator", creator]
+    prs = []
     try:
-        output = run_az(args, timeout=30)
-        return json.loads(output) if output else []
-    except (RuntimeError, json.JSONDecodeError):
-        return []
+        while True:
+            output = run_az(args + ["--skip", str(len(prs))], timeout=30)
+            page = _json_loads(output) if output else []
+            prs.extend(map(_slim_pr, page))
+            if len(page) < _PR_PAGE_SIZE:
+                return prs
+    except (RuntimeError, ValueError):
+        return prs
 
 
 def list_devops_projects(org: str) -> list[str]:
+    data = api_get(f"{org.rstrip('/')}/_apis/projects?$top=500&api-version=7.1", _DEVOPS_RESOURCE)
+    if data and "value" in data:
+        return [p["name"] for p in data["value"]]
     output = run_az(["devops", "project", "list", "--org", org,
                       "-o", "json", "--top", "500"], timeout=30)
-    data = json.loads(output) if output else {}
+    data = _json_loads(output) if output else {}
     return [p["name"] for p in data.get("value", [])]
 
 
@@ -91,45 +341,77 @@ def get_devops_activity(org: str, projects: list[str], creator: str,
     """Returns {date_str: [pr_summaries]} for PRs created or closed in range."""
     daily = defaultdict(list)
 
-    for project in projects:
-        for status in ["completed", "active", "abandoned"]:
-            prs = fetch_devops_prs(org, project, status, creator=creator)
-            for pr in prs:
-                repo_name = pr.get("repository", {}).get("name", "?")
-                pr_id = pr["pullRequestId"]
-                title = pr.get("title", "Untitled")
-                pr_status = pr.get("status", "?")
-                target = (pr.get("targetRefName") or "").replace("refs/heads/", "")
-
-                # Check created date
-                created_str = pr.get("creationDate", "")
-                created_dt = _parse_iso(created_str)
-                if created_dt and start <= created_dt <= end:
-                    date_key = created_dt.strftime("%Y-%m-%d")
-                    daily[date_key].append({
-                        "type": "pr_created",
-                        "project": project,
-                        "repo": repo_name,
-                        "pr_id": pr_id,
-                        "title": title,
-                        "status": pr_status,
-                        "target": target,
-                    })
-
-                # Check closed date (for completed PRs merged on a different day)
-                closed_str = pr.get("closedDate", "")
-                closed_dt = _parse_iso(closed_str)
-                if closed_dt and start <= closed_dt <= end:
-                    closed_key = closed_dt.strftime("%Y-%m-%d")
-                    if closed_key != (created_dt.strftime("%Y-%m-%d") if created_dt else ""):
-                        daily[closed_key].append({
-                            "type": "pr_completed",
-                            "project": project,
-                            "repo": repo_name,
-                            "pr_id": pr_id,
-                            "title": title,
-                            "target": target,
-                        })
+    # Per project, the server returns only PRs created in range plus those
+    # closed in range. The queries are independent and I/O-bound, so run them
+    # concurrently and merge in submission order so output is stable.
+    tasks = [(project, kind) for project in projects for kind in ("created", "closed")]
+    if not tasks:
+        return {}
+
+    # The az fallback can't filter by date, so both kinds would list the
+    # project's whole history; run it at most once per project and share it
+    az_locks = {project: threading.Lock() for project in projects}
+    az_prs: dict[str, list[dict]] = {}
+
+    def fetch(task: tuple[str, str]) -> list[dict]:
+        project, kind = task
+        prs = _fetch_prs_rest(org, project, "all", creator, (kind, start, end))
+        if prs is not None:
+            return prs
+        with az_locks[project]:
+            if project not in az_prs:
+                az_prs[project] = _fetch_prs_az(org, project, "all", creator)
+            return az_prs[project]
+
+    with ThreadPoolExecutor(max_workers=min(16, len(tasks))) as pool:
+        results = list(pool.map(fetch, tasks))
+
+    # PR ids are unique per organization, so keying on them alone also drops
+    # a PR listed under two spellings of the same project (or --project A,A);
+    # each PR then yields at most one created and one completed event
+    prs_by_id: dict[int, tuple[str, dict]] = {}
+    for (project, _), prs in zip(tasks, results):
+        for pr in prs:
+            prs_by_id.setdefault(pr["pullRequestId"], (project, pr))
+
+    # The date checks below stay: they decide which event(s) a PR yields, and
+    # the az fallback is not date-filtered
+    for project, pr in prs_by_id.values():
+        repo_name = pr.get("repository", {}).get("name", "?")
+        pr_id = pr["pullRequestId"]
+        title = pr.get("title", "Untitled")
+        pr_status = pr.get("status", "?")
+        target = (pr.get("targetRefName") or "").replace("refs/heads/", "")
+
+        # Check created date
+        created_str = pr.get("creationDate", "")
+        created_dt = _parse_iso(created_str)
+        if created_dt and start <= created_dt <= end:
+            date_key = _date_key(created_dt)
+            daily[date_key].append({
+                "type": "pr_created",
+                "project": project,
+                "repo": repo_name,
+                "pr_id": pr_id,
+                "title": title,
+                "status": pr_status,
+                "target": target,
+            })
+
+        # Check closed date (for completed PRs merged on a different day)
+        closed_str = pr.get("closedDate", "")
+        closed_dt = _parse_iso(closed_str)
+        if closed_dt and start <= closed_dt <= end:
+            closed_key = _date_key(closed_dt)
+            if closed_key != (_date_key(created_dt) if created_dt else ""):
+                daily[closed_key].append({
+                    "type": "pr_completed",
+                    "project": project,
+                    "repo": repo_name,
+                    "pr_id": pr_id,
+                    "title": title,
+                    "target": target,
+                })
 
     return dict(daily)
 
@@ -137,6 +419,39 @@ def get_devops_activity(org: str, projects: list[str], creator: str,
 # ── Claude Code History ───────────────────────────────────────────────────────
 
 
+_DAY_MS = 86_400_000
+
+# history.jsonl is append-only, so entries are in time order give or take
+# concurrent sessions writing slightly out of order; allow this much slack.
+_HISTORY_SLACK_MS = 3600 * 1000
+_HISTORY_TS_RE = re.compile(rb'"timestamp"\s*:\s*(\d+)')
+
+
+def _seek_history(f, target_ms: int) -> None:
+    """Bisect the binary file `f` to a line start at or shortly before the
+    first entry with timestamp >= `target_ms`."""
+    lo, hi = 0, f.seek(0, os.SEEK_END)
+    while hi - lo > 1 << 16:
+        mid = (lo + hi) // 2
+        f.seek(mid)
+        f.readline()  # discard the partial line
+        ts = None
+        while ts is None:
+            line = f.readline()
+            if not line:
+                break
+            m = _HISTORY_TS_RE.search(line)
+            if m:
+                ts = int(m.group(1))
+        if ts is None or ts >= target_ms:
+            hi = mid
+        else:
+            lo = mid
+    f.seek(lo)
+    if lo:
+        f.readline()
+
+
 def get_claude_activity(start: datetime, end: datetime) -> dict[str, list[dict]]:
     """Parse ~/.claude/history.jsonl for session activity per day."""
     history_file = Path.home() / ".claude" / "history.jsonl"
@@ -144,49 +459,64 @@ def get_claude_activity(start: datetime, end: datetime) -> dict[str, list[dict]]
         return {}
 
     daily = defaultdict(list)
-    sessions_by_day = defaultdict(lambda: defaultdict(set))
+    sessions: dict[tuple[int, str], set[str]] = {}  # (UTC day number, project) -> session ids
 
     start_ms = int(start.timestamp() * 1000)
     end_ms = int(end.timestamp() * 1000)
 
-    for line in history_file.read_text().splitlines():
-        try:
-            entry = json.loads(line)
-        except json.JSONDecodeError:
-            continue
+    # Stream the file from just before the window and stop just after it;
+    # the file can grow to hundreds of MB over time
+    with history_file.open("rb", buffering=1 << 20) as f:
+        _seek_history(f, start_ms - _HISTORY_SLACK_MS)
+        for line in f:
+            # Blank or truncated lines can't be entries; skip them before parsing
+            if line[:1] != b"{":
+                continue
+            try:
+                entry = _json_loads(line)
+            except ValueError:
+                continue
 
-        ts = entry.get("timestamp")
-        if not isinstance(ts, (int, float)):
-            continue
-        if ts < start_ms or ts > end_ms:
-            continue
+            ts = entry.get("timestamp")
+            if not isinstance(ts, (int, float)):
+                continue
+            if ts > end_ms + _HISTORY_SLACK_MS:
+                break
+            if ts < start_ms or ts > end_ms:
+                continue
 
-        project = entry.get("project", "")
-        display = entry.get("display", "")
-        session_id = entry.get("sessionId", "")
-        date_key = datetime.fromtimestamp(ts / 1000, tz=timezone.utc).strftime("%Y-%m-%d")
-
-        # Extract project short name from path
-        # Worktree paths like /home/ewi/.orcha/worktrees/TeamPlanner/session-1-xxxx
-        # should resolve to "TeamPlanner", not the session dir name
-        if project:
-            p = Path(project)
-            project_name = p.name
-            # If it looks like a worktree session, use the parent dir name
-            if (project_name.startswith("session-") or
-                    project_name.startswith("pl-") or
-                    project_name.startswith("HIVE-")):
-                project_name = p.parent.name
-            sessions_by_day[date_key][project_name].add(session_id)
+            project = entry.get("project", "")
+            session_id = entry.get("sessionId", "")
+            day = int(ts // _DAY_MS)  # UTC day number; formatted once per day below
+
+            # Extract project short name from path
+            # Worktree paths like /home/ewi/.orcha/worktrees/TeamPlanner/session-1-xxxx
+            # should resolve to "TeamPlanner", not the session dir name
+            if project:
+                p = Path(project)
+                project_name = p.name
+                # If it looks like a worktree session, use the parent dir name
+                if (project_name.startswith("session-") or
+                        project_name.startswith("pl-") or
+                        project_name.startswith("HIVE-")):
+                    project_name = p.parent.name
+                key = (day, project_name)
+                ids = sessions.get(key)
+                if ids is None:
+                    ids = sessions[key] = set()
+                ids.add(session_id)
 
     # Summarize per day
-    for date_key, projects in sessions_by_day.items():
-        for project_name, session_ids in projects.items():
-            daily[date_key].append({
-                "type": "claude_session",
-                "project": project_name,
-                "sessions": len(session_ids),
-            })
+    date_keys = {}
+    for (day, project_name), session_ids in sessions.items():
+        date_key = date_keys.get(day)
+        if date_key is None:
+            date_key = date_keys[day] = _date_key(datetime.fromtimestamp(day * 86400, tz=timezone.utc))
+        daily[date_key].append({
+            "type": "claude_session",
+            "project": project_name,
+            "sessions": len(session_ids),
+        })
 
     return dict(daily)
 
@@ -199,24 +529,34 @@ def get_calendar_activity(start: datetime, end: datetime) -> dict[str, list[dict
     start_str = start.strftime("%Y-%m-%dT00:00:00Z")
     end_str = end.strftime("%Y-%m-%dT23:59:59Z")
 
-    try:
-        url = (
-            f"https://graph.microsoft.com/v1.0/me/calendarView"
-            f"?startDateTime={start_str}&endDateTime={end_str}"
-            f"&$select=subject,start,end,isAllDay,organizer,showAs,isCancelled"
-            f"&$orderby=start/dateTime&$top=200"
-        )
-        output = run_az(["rest", "--method", "GET", "--url", url,
-                          "--headers", "Content-Type=application/json"], timeout=30)
-        data = json.loads(output)
-    except (RuntimeError, json.JSONDecodeError) as e:
-        print(f"  Calendar fetch failed: {e}", file=sys.stderr)
-        print("  Tip: run 'az login --scope \"https://graph.microsoft.com/Calendars.Read\"'",
-              file=sys.stderr)
-        return {}
+    url = (
+        f"https://graph.microsoft.com/v1.0/me/calendarView"
+        f"?startDateTime={start_str}&endDateTime={end_str}"
+        f"&$select=subject,start,end,isAllDay,organizer,showAs,isCancelled"
+        f"&$orderby=start/dateTime&$top=1000"
+    )
+    # Graph pages with opaque @odata.nextLink URLs, so pages are fetched in turn
+    events = []
+    while url:
+        try:
+            data = api_get(url, _GRAPH_RESOURCE)
+            if data is None:
+                output = run_az(["rest", "--method", "GET", "--url", url,
+                                  "--headers", "Content-Type=application/json"], timeout=30)
+                data = _json_loads(output)
+        except (RuntimeError, ValueError) as e:
+            if events:
+                print(f"  Calendar: stopped after {len(events)} events: {e}", file=sys.stderr)
+                break
+            print(f"  Calendar fetch failed: {e}", file=sys.stderr)
+            print("  Tip: run 'az login --scope \"https://graph.microsoft.com/Calendars.Read\"'",
+                  file=sys.stderr)
+            return {}
+        events.extend(data.get("value", []))
+        url = data.get("@odata.nextLink")
 
     daily = defaultdict(list)
-    for event in data.get("value", []):
+    for event in events:
         if event.get("isCancelled"):
             continue
         subject = event.get("subject", "(no subject)")
@@ -252,62 +592,79 @@ def get_calendar_activity(start: datetime, end: datetime) -> dict[str, list[dict
 # ── Git Commits ───────────────────────────────────────────────────────────────
 
 
+def _subdirs(parent: str) -> list[os.DirEntry]:
+    """Directories directly under `parent`; empty if it doesn't exist."""
+    try:
+        with os.scandir(parent) as it:
+            return [e for e in it if e.is_dir()]
+    except OSError:
+        return []
+
+
+def _is_git_repo(path: str) -> bool:
+    # .git is a directory in clones and a file in worktrees/submodules
+    return os.path.lexists(os.path.join(path, ".git"))
+
+
+def _git_log_days(repo: str, start_str: str, end_str: str) -> list[str]:
+    """Return the author date (YYYY-MM-DD) of each commit in `repo` in range."""
+    try:
+        result = subprocess.run(
+            ["git", "-C", repo, "log", "--all",
+             f"--after={start_str}", f"--before={end_str}",
+             # Only the author date is used; git formats it in the author's
+             # own timezone, as %aI did
+             "--pretty=tformat:%ad", "--date=format:%Y-%m-%d", "--author-date-order"],
+            capture_output=True, text=True, timeout=10
+        )
+    except (subprocess.TimeoutExpired, Exception):
+        return []
+    if result.returncode != 0:
+        return []
+    return result.stdout.split()
+
+
 def get_git_activity(start: datetime, end: datetime) -> dict[str, list[dict]]:
     """Scan known repo locations for git commits in the date range."""
     daily = defaultdict(list)
-    commits_by_day = defaultdict(lambda: defaultdict(int))
-
-    # Find repos
-    repos_dir = Path.home() / "repos"
-    repo_paths = []
-
-    if repos_dir.exists():
-        for d in repos_dir.iterdir():
-            if d.is_dir() and (d / ".git").exists():
-                repo_paths.append(d)
-            # Check for nested repos (e.g. orcha-clones/)
-            if d.is_dir():
-                for sub in d.iterdir():
-                    if sub.is_dir() and (sub / ".git").exists():
-                        repo_paths.append(sub)
+    commits: Counter[tuple[str, str]] = Counter()  # (date, repo) -> commit count
+
+    # Find repos as (path, name); scandir's cached file types spare a stat per entry
+    home = str(Path.home())
+    repos = []
+
+    for d in _subdirs(os.path.join(home, "repos")):
+        if _is_git_repo(d.path):
+            repos.append((d.path, d.name))
+        # Check for nested repos (e.g. orcha-clones/)
+        for sub in _subdirs(d.path):
+            if _is_git_repo(sub.path):
+                repos.append((sub.path, sub.name))
 
     # Also check common worktree locations
-    for wt_parent in [Path.home() / "orcha-worktrees", Path.home() / "hive-repos"]:
-        if wt_parent.exists():
-            for d in wt_parent.iterdir():
-                if d.is_dir() and ((d / ".git").exists() or (d / ".git").is_file()):
-                    repo_paths.append(d)
+    for wt_parent in ("orcha-worktrees", "hive-repos"):
+        for d in _subdirs(os.path.join(home, wt_parent)):
+            if _is_git_repo(d.path):
+                repos.append((d.path, d.name))
 
     start_str = start.strftime("%Y-%m-%d")
     end_str = (end + timedelta(days=1)).strftime("%Y-%m-%d")
 
-    for repo in repo_paths:
-        repo_name = repo.name
-        try:
-            result = subprocess.run(
-                ["git", "-C", str(repo), "log", "--all",
-                 f"--after={start_str}", f"--before={end_str}",
-                 "--format=%aI|%s", "--author-date-order"],
-                capture_output=True, text=True, timeout=10
-            )
-            if result.returncode != 0:
-                continue
-            for line in result.stdout.strip().splitlines():
-                if "|" not in line:
-                    continue
-                date_part, _, msg = line.partition("|")
-                date_key = date_part[:10]
-                commits_by_day[date_key][repo_name] += 1
-        except (subprocess.TimeoutExpired, Exception):
-            continue
+    # Each git log is its own process, so scanning repos concurrently scales
+    # with cores and disk; counts are merged here on the main thread
+    if repos:
+        workers = min(32, (os.cpu_count() or 1) * 4, len(repos))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(lambda repo: _git_log_days(repo[0], start_str, end_str), repos)
+            for (_, repo_name), date_keys in zip(repos, results):
+                commits.update((date_key, repo_name) for date_key in date_keys)
 
-    for date_key, repos in commits_by_day.items():
-        for repo_name, count in repos.items():
-            daily[date_key].append({
-                "type": "git_commit",
-                "repo": repo_name,
-                "commits": count,
-            })
+    for (date_key, repo_name), count in commits.items():
+        daily[date_key].append({
+            "type": "git_commit",
+            "repo": repo_name,
+            "commits": count,
+        })
 
     return dict(daily)
 
@@ -315,13 +672,30 @@ def get_git_activity(start: datetime, end: datetime) -> dict[str, list[dict]]:
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 
-def _parse_iso(s: str) -> datetime | None:
-    if not s:
-        return None
-    try:
-        return datetime.fromisoformat(s.replace("Z", "+00:00"))
-    except (ValueError, AttributeError):
-        return None
+def _date_key(d) -> str:
+    """YYYY-MM-DD for a date or datetime; cheaper than strftime in hot loops."""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing "Z" natively
+    def _parse_iso(s: str) -> datetime | None:
+        if not s:
+            return None
+        try:
+            return datetime.fromisoformat(s)
+        except (ValueError, TypeError):
+            return None
+else:
+    def _parse_iso(s: str) -> datetime | None:
+        if not s:
+            return None
+        try:
+            if s.endswith("Z"):
+                s = s[:-1] + "+00:00"
+            return datetime.fromisoformat(s)
+        except (ValueError, AttributeError):
+            return None
 
 
 WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
@@ -332,85 +706,95 @@ def merge_daily(sources: list[dict[str, list[dict]]]) -> dict[str, list[dict]]:
     for source in sources:
         for date_key, items in source.items():
             merged[date_key].extend(items)
-    return dict(merged)
+    # Callers only read, so hand back the defaultdict rather than copying it
+    return merged
 
 
 # ── Output Formatters ─────────────────────────────────────────────────────────
 
 
 def format_text(daily: dict[str, list[dict]], start: datetime, end: datetime) -> str:
-    lines = []
-    lines.append(f"Time Report: {start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')}")
-    lines.append("=" * 70)
+    buf = io.StringIO()
+    w = buf.write
+    w(f"Time Report: {_date_key(start)} to {_date_key(end)}\n")
+    w("=" * 70 + "\n")
 
     d = start.date() if hasattr(start, 'date') else start
     end_d = end.date() if hasattr(end, 'date') else end
+    # Summary totals, gathered while rendering each day
+    working_days = 0
+    total_prs = 0
+    all_pr_projects = set()
+    all_claude_projects = set()
 
     while d <= end_d:
-        date_str = d.strftime("%Y-%m-%d")
+        date_str = _date_key(d)
         day_name = WEEKDAYS[d.weekday()]
         items = daily.get(date_str, [])
 
         if not items:
-            lines.append(f"\n{date_str} ({day_name})  --")
+            w(f"\n{date_str} ({day_name})  --\n")
             d += timedelta(days=1)
             continue
 
-        lines.append(f"\n{date_str} ({day_name})")
+        w(f"\n{date_str} ({day_name})\n")
+        if d.weekday() < 5:
+            working_days += 1
 
         # Group by type
-        prs_created = [i for i in items if i["type"] == "pr_created"]
-        prs_completed = [i for i in items if i["type"] == "pr_completed"]
-        calendar = [i for i in items if i["type"] == "calendar"]
-        claude = [i for i in items if i["type"] == "claude_session"]
-        git = [i for i in items if i["type"] == "git_commit"]
+        by_type = defaultdict(list)
+        for i in items:
+            by_type[i["type"]].append(i)
+        prs_created = by_type["pr_created"]
+        prs_completed = by_type["pr_completed"]
+        calendar = by_type["calendar"]
+        claude = by_type["claude_session"]
+        git = by_type["git_commit"]
 
         # Calendar events
         for evt in calendar:
             time_str = evt["start"]
             if evt["end"]:
                 time_str += f"-{evt['end']}"
-            lines.append(f"  CAL  {time_str:16s} {evt['subject']}")
+            w(f"  CAL  {time_str:16s} {evt['subject']}\n")
 
         # PRs
+        total_prs += len(prs_created)
         for pr in prs_created:
+            if pr.get("project"):
+                all_pr_projects.add(pr["project"])
             status_tag = f"[{pr['status']}]" if pr["status"] != "completed" else ""
             target_tag = f" -> {pr['target']}" if pr.get("target") and pr["target"] != "main" else ""
-            lines.append(f"  PR   #{pr['pr_id']:<6d} {pr['title'][:60]}{target_tag} {status_tag}")
+            w(f"  PR   #{pr['pr_id']:<6d} {pr['title'][:60]}{target_tag} {status_tag}\n")
 
         for pr in prs_completed:
-            lines.append(f"  PR   #{pr['pr_id']:<6d} (merged) {pr['title'][:55]}")
+            w(f"  PR   #{pr['pr_id']:<6d} (merged) {pr['title'][:55]}\n")
 
         # Claude Code sessions
         for session in sorted(claude, key=lambda s: s["sessions"], reverse=True):
-            lines.append(f"  CODE {session['project']:30s} ({session['sessions']} session{'s' if session['sessions'] != 1 else ''})")
+            w(f"  CODE {session['project']:30s} ({session['sessions']} session{'s' if session['sessions'] != 1 else ''})\n")
 
         # Git commits (only show if no Claude session for same project)
         claude_projects = {s["project"] for s in claude}
+        all_claude_projects |= claude_projects
         for g in sorted(git, key=lambda x: x["commits"], reverse=True):
             if g["repo"] not in claude_projects:
-                lines.append(f"  GIT  {g['repo']:30s} ({g['commits']} commit{'s' if g['commits'] != 1 else ''})")
+                w(f"  GIT  {g['repo']:30s} ({g['commits']} commit{'s' if g['commits'] != 1 else ''})\n")
 
         d += timedelta(days=1)
 
     # Summary
-    lines.append("\n" + "=" * 70)
-    all_prs = [i for items in daily.values() for i in items if i["type"] == "pr_created"]
-    all_projects = sorted(set(i.get("project", "") for i in all_prs if i.get("project")))
-    lines.append(f"Total PRs created: {len(all_prs)}")
-    if all_projects:
-        lines.append(f"Projects: {', '.join(all_projects)}")
+    w("\n" + "=" * 70 + "\n")
+    w(f"Total PRs created: {total_prs}\n")
+    if all_pr_projects:
+        w(f"Projects: {', '.join(sorted(all_pr_projects))}\n")
 
-    all_claude = [i for items in daily.values() for i in items if i["type"] == "claude_session"]
-    claude_projects = sorted(set(i["project"] for i in all_claude))
-    if claude_projects:
-        lines.append(f"Claude Code projects: {', '.join(claude_projects)}")
+    if all_claude_projects:
+        w(f"Claude Code projects: {', '.join(sorted(all_claude_projects))}\n")
 
-    working_days = sum(1 for d_str, items in daily.items()
-                       if items and datetime.strptime(d_str, "%Y-%m-%d").weekday() < 5)
-    lines.append(f"Working days with activity: {working_days}")
+    w(f"Working days with activity: {working_days}")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def format_json(daily: dict[str, list[dict]], start: datetime, end: datetime) -> str:
@@ -436,6 +820,8 @@ def main():
     parser.add_argument("--no-claude", action="store_true", help="Skip Claude Code history")
     parser.add_argument("--no-git", action="store_true", help="Skip git commit history")
     parser.add_argument("--json", action="store_true", help="Output JSON instead of text")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Ignore cached az defaults and account (re-query az)")
     args = parser.parse_args()
 
     # Determine date range
@@ -462,12 +848,12 @@ def main():
     # 1. Azure DevOps PRs
     if not args.no_devops:
         try:
-            defaults = get_devops_defaults()
+            defaults = get_devops_defaults(not args.refresh)
             org = defaults.get("organization", "")
             if not org:
                 print("  DevOps: no org configured, skipping", file=sys.stderr)
             else:
-                creator = run_az(["account", "show", "--query", "user.name", "-o", "tsv"])
+                creator = get_account_user(not args.refresh)
                 if args.project:
                     projects = [p.strip() for p in args.project.split(",")]
                 elif args.all_projects: